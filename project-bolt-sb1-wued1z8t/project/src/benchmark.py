@@ -0,0 +1,270 @@
+import argparse
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+import cv2
+import numpy as np
+from datetime import datetime
+from PIL import Image
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from modules.ai_detector import AIDetector
+from modules.blind_spot_monitor import BlindSpotMonitor
+from modules.camera_handler import CameraHandler
+from modules.display_renderer import DisplayRenderer
+from modules.frame_context import FrameContext
+from modules.lane_estimator import LaneEstimator
+from modules.vehicle_tracker import VehicleTracker
+
+RESOLUTIONS = {
+    '480p': (640, 480),
+    '720p': (1280, 720),
+    '1080p': (1920, 1080),
+}
+
+DISPLAY_SIZE = (1040, 650)
+FRAME_POOL = 30
+
+def synthetic_frames(width: int, height: int, count: int = FRAME_POOL, seed: int = 0) -> List[np.ndarray]:
+    rng = np.random.default_rng(seed)
+    sky = np.linspace(90, 30, height // 2, dtype=np.float32)[:, None, None]
+    road = np.linspace(60, 110, height - height // 2, dtype=np.float32)[:, None, None]
+    background = np.concatenate((np.broadcast_to(sky, (height // 2, width, 3)),
+                                 np.broadcast_to(road, (height - height // 2, width, 3))), axis=0)
+
+    frames = []
+    for index in range(count):
+        frame = background.astype(np.uint8)
+        for offset in (-0.35, 0.35):
+            cv2.line(frame, (int(width * (0.5 + offset)), height), (int(width * (0.5 + offset / 6)), height // 2),
+                     (230, 230, 230), max(2, width // 200))
+
+        for lane in range(3):
+            x = int((0.15 + 0.3 * lane + 0.01 * index) % 0.9 * width)
+            y = int(height * (0.55 + 0.1 * lane))
+            size = int(width * (0.08 + 0.04 * lane))
+            cv2.rectangle(frame, (x, y), (x + size, y + int(size * 0.7)), (40 + 60 * lane, 50, 200 - 50 * lane), -1)
+
+        noise = rng.integers(0, 12, frame.shape, dtype=np.uint8)
+        frames.append(cv2.add(frame, noise))
+    return frames
+
+def video_frames(path: str, width: int, height: int, count: int = FRAME_POOL) -> List[np.ndarray]:
+    capture = cv2.VideoCapture(path)
+    frames = []
+    while len(frames) < count:
+        ret, frame = capture.read()
+        if not ret:
+            break
+        frames.append(cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA))
+    capture.release()
+
+    if not frames:
+        raise ValueError(f"Could not read frames from {path}")
+    return frames
+
+def _stage_process_frame() -> Callable:
+    handler = CameraHandler()
+    handler.current_view = "rear"
+    slots: Dict[Tuple[int, ...], np.ndarray] = {}
+
+    def run(frame):
+        slot = slots.get(frame.shape)
+        if slot is None:
+            slot = slots[frame.shape] = np.empty_like(frame)
+        return handler._process_frame(frame, slot)
+    return run
+
+def _stage_lane_lines() -> Callable:
+    detector = AIDetector()
+    return lambda frame: detector.detect_lane_lines(frame)
+
+def _stage_vehicles() -> Callable:
+    detector = AIDetector()
+    return lambda frame: detector.detect_vehicles(frame)
+
+def _stage_blind_spot() -> Callable:
+    detector = AIDetector()
+    return lambda frame: detector.check_blind_spot(frame, "left")
+
+def _stage_display_convert() -> Callable:
+    renderer = DisplayRenderer(None)
+    return lambda frame: renderer.prepare(frame, DISPLAY_SIZE)
+
+def _stage_display_pil() -> Callable:
+    def run(frame):
+        image = Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+        return image.resize(DISPLAY_SIZE, Image.Resampling.LANCZOS)
+    return run
+
+def _stage_pipeline() -> Callable:
+    handler = CameraHandler()
+    handler.current_view = "left"
+    detector = AIDetector()
+    lanes = LaneEstimator()
+    tracker = VehicleTracker()
+    monitor = BlindSpotMonitor()
+    renderer = DisplayRenderer(None)
+    slots: Dict[Tuple[int, ...], np.ndarray] = {}
+    sequence = [0]
+
+    def run(frame):
+        slot = slots.get(frame.shape)
+        if slot is None:
+            slot = slots[frame.shape] = np.empty_like(frame)
+        frame = handler._process_frame(frame, slot)
+
+        sequence[0] += 1
+        context = FrameContext.of(frame, sequence[0])
+        lines = lanes.update(context, detector)
+        vehicles = tracker.detect(context, detector)
+        monitor.update(context, detector)
+
+        frame = detector.draw_lane_lines(frame, lines)
+        frame = detector.draw_vehicle_detections(frame, vehicles)
+        return renderer.prepare(frame, DISPLAY_SIZE)
+    return run
+
+STAGES = {
+    'process_frame': _stage_process_frame,
+    'lane_lines': _stage_lane_lines,
+    'vehicles': _stage_vehicles,
+    'blind_spot': _stage_blind_spot,
+    'display_convert': _stage_display_convert,
+    'display_pil_legacy': _stage_display_pil,
+    'pipeline': _stage_pipeline,
+}
+
+def measure(run: Callable, frames: List[np.ndarray], iterations: int, warmup: int,
+            allocation_samples: int) -> Dict:
+    for index in range(warmup):
+        run(frames[index % len(frames)])
+
+    timings = np.empty(iterations, dtype=np.float64)
+    started = time.perf_counter()
+    for index in range(iterations):
+        frame = frames[index % len(frames)]
+        tick = time.perf_counter_ns()
+        run(frame)
+        timings[index] = (time.perf_counter_ns() - tick) / 1e6
+    elapsed = time.perf_counter() - started
+
+    allocations = []
+    tracemalloc.start()
+    for index in range(allocation_samples):
+        baseline = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        run(frames[index % len(frames)])
+        allocations.append(tracemalloc.get_traced_memory()[1] - baseline)
+    tracemalloc.stop()
+
+    p50, p95, p99 = np.percentile(timings, [50, 95, 99])
+    return {
+        'iterations': iterations,
+        'p50_ms': round(float(p50), 3),
+        'p95_ms': round(float(p95), 3),
+        'p99_ms': round(float(p99), 3),
+        'mean_ms': round(float(timings.mean()), 3),
+        'max_ms': round(float(timings.max()), 3),
+        'throughput_fps': round(iterations / elapsed, 1) if elapsed > 0 else None,
+        'peak_alloc_bytes_per_frame': int(np.mean(allocations)) if allocations else None,
+    }
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except Exception:
+        return None
+
+def run_benchmarks(resolutions: Iterable[str], stages: Iterable[str], videos: Iterable[str],
+                   iterations: int, warmup: int, allocation_samples: int) -> Dict:
+    results = []
+    sources = [('synthetic', None)] + [(path, path) for path in videos]
+
+    for source_name, path in sources:
+        for resolution in resolutions:
+            width, height = RESOLUTIONS[resolution]
+            try:
+                frames = synthetic_frames(width, height) if path is None else video_frames(path, width, height)
+            except Exception as e:
+                results.append({'source': source_name, 'resolution': resolution, 'stage': None,
+                                'error': f"{type(e).__name__}: {e}"})
+                print(f"{source_name:>12} {resolution:>6}  ERROR {results[-1]['error']}")
+                continue
+
+            for stage in stages:
+                entry = {'source': source_name, 'resolution': resolution, 'stage': stage}
+                results.append(entry)
+                try:
+                    entry.update(measure(STAGES[stage](), frames, iterations, warmup, allocation_samples))
+                except Exception as e:
+                    tracemalloc.stop()
+                    entry['error'] = f"{type(e).__name__}: {e}"
+                    print(f"{source_name:>12} {resolution:>6} {stage:>20}  ERROR {entry['error']}")
+                    continue
+                print(f"{source_name:>12} {resolution:>6} {stage:>20}  p50 {entry['p50_ms']:8.2f} ms  "
+                      f"p95 {entry['p95_ms']:8.2f} ms  p99 {entry['p99_ms']:8.2f} ms  "
+                      f"{entry['throughput_fps']:8.1f} fps  {entry['peak_alloc_bytes_per_frame'] or 0:>10} B")
+
+    return {
+        'created_at': datetime.now().isoformat(),
+        'revision': _git_revision(),
+        'environment': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'opencv': cv2.__version__,
+            'numpy': np.__version__,
+        },
+        'results': results,
+    }
+
+def compare(current: Dict, baseline_path: str, metric: str = 'p95_ms'):
+    with open(baseline_path) as handle:
+        baseline = json.load(handle)
+
+    previous = {(r['source'], r['resolution'], r['stage']): r for r in baseline['results']}
+    print(f"\nComparison of {metric} against {baseline.get('revision') or baseline_path}:")
+    for result in current['results']:
+        old = previous.get((result['source'], result['resolution'], result['stage']))
+        if old is None or not old.get(metric) or metric not in result:
+            continue
+        change = (result[metric] - old[metric]) / old[metric] * 100
+        print(f"{result['source']:>12} {result['resolution']:>6} {result['stage']:>20}  "
+              f"{old[metric]:8.2f} -> {result[metric]:8.2f} ms  ({change:+.1f}%)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmarks for the camera-to-display pipeline")
+    parser.add_argument('--resolutions', default='480p,720p', help=f"comma list of {','.join(RESOLUTIONS)}")
+    parser.add_argument('--stages', default=','.join(STAGES), help=f"comma list of {','.join(STAGES)}")
+    parser.add_argument('--video', action='append', default=[], help="recorded video to include (repeatable)")
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--warmup', type=int, default=10)
+    parser.add_argument('--allocation-samples', type=int, default=20)
+    parser.add_argument('--output', default='benchmark_results.json')
+    parser.add_argument('--compare', help="previous results JSON to diff against")
+    args = parser.parse_args()
+
+    resolutions = [r for r in args.resolutions.split(',') if r]
+    stages = [s for s in args.stages.split(',') if s]
+    unknown = [r for r in resolutions if r not in RESOLUTIONS] + [s for s in stages if s not in STAGES]
+    if unknown:
+        parser.error(f"unknown resolutions or stages: {', '.join(unknown)}")
+
+    results = run_benchmarks(resolutions, stages, args.video, args.iterations, args.warmup,
+                             args.allocation_samples)
+
+    with open(args.output, 'w') as handle:
+        json.dump(results, handle, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+    failed = [r for r in results['results'] if 'error' in r]
+    if failed:
+        print(f"\n{len(failed)} stage run(s) failed")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,25 @@
+import argparse
+import time
+from modules.headless_pipeline import run_batch
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the detection stack on recorded video without the GUI")
+    parser.add_argument('inputs', nargs='+', help="video files, image directories or quoted glob patterns")
+    parser.add_argument('--output', default='detections.jsonl')
+    parser.add_argument('--format', choices=('jsonl', 'parquet'), default='jsonl')
+    parser.add_argument('--workers', type=int, default=None, help="processes to use (default: all cores)")
+    parser.add_argument('--segment-frames', type=int, default=1800, help="frames per parallel segment")
+    parser.add_argument('--view', choices=('left', 'right', 'rear', 'center'), default='rear',
+                        help="camera view recorded with each frame (both blind spots are always reported)")
+    parser.add_argument('--mirror', action='store_true', help="flip frames horizontally like the live view")
+    parser.add_argument('--stride', type=int, default=1, help="analyse every Nth frame")
+    args = parser.parse_args()
+
+    started = time.monotonic()
+    frames = run_batch(args.inputs, args.output, args.format, args.workers, args.segment_frames,
+                       args.view, args.mirror, args.stride)
+    elapsed = time.monotonic() - started
+    print(f"Processed {frames} frames in {elapsed:.1f}s ({frames / max(elapsed, 1e-6):.1f} fps) -> {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,35 +1,72 @@
 import cv2
 import numpy as np
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+from modules.frame_context import FrameContext
+from modules.contour_filter import contour_stats
+
+VEHICLE_DTYPE = np.dtype([
+    ('x', np.int32), ('y', np.int32), ('w', np.int32), ('h', np.int32),
+    ('area', np.float32), ('confidence', np.float32)
+])
 
 class AIDetector:
     def __init__(self):
         self.detection_enabled = False
         self.cascade_classifier = None
-        self._initialize_detectors()
-
-    def _initialize_detectors(self):
-        try:
-            self.cascade_classifier = cv2.CascadeClassifier(
-                cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
-            )
-        except Exception as e:
-            print(f"AI Detector initialization warning: {e}")
-
-    def detect_lane_lines(self, frame) -> List[np.ndarray]:
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        blur = cv2.GaussianBlur(gray, (5, 5), 0)
-        edges = cv2.Canny(blur, 50, 150)
-
-        height, width = edges.shape
-        mask = np.zeros_like(edges)
-        polygon = np.array([[
-            (0, height),
-            (width // 2 - 50, height // 2),
-            (width // 2 + 50, height // 2),
-            (width, height)
-        ]], np.int32)
-        cv2.fillPoly(mask, polygon, 255)
+        self._context: Optional[FrameContext] = None
+        self._lane_mask: Optional[np.ndarray] = None
+        self._band_mask: Optional[np.ndarray] = None
+
+    def cascade(self):
+        if self.cascade_classifier is None:
+            try:
+                self.cascade_classifier = cv2.CascadeClassifier(
+                    cv2.data.haarcascades + 'haarcascade_frontalface_default.xml'
+                )
+            except Exception as e:
+                print(f"AI Detector initialization warning: {e}")
+        return self.cascade_classifier
+
+    def prepare_frame(self, frame, sequence: Optional[int] = None) -> FrameContext:
+        context = self._context
+        if context is not None and sequence is not None and context.sequence == sequence:
+            return context
+
+        context = FrameContext.of(frame, sequence)
+        self._context = context
+        return context
+
+    def lane_mask(self, shape) -> np.ndarray:
+        height, width = shape[:2]
+        if self._lane_mask is None or self._lane_mask.shape != (height, width):
+            mask = np.zeros((height, width), dtype=np.uint8)
+            polygon = np.array([[
+                (0, height),
+                (width // 2 - 50, height // 2),
+                (width // 2 + 50, height // 2),
+                (width, height)
+            ]], np.int32)
+            cv2.fillPoly(mask, polygon, 255)
+            self._lane_mask = mask
+        return self._lane_mask
+
+    def band_mask(self, polygons: List[np.ndarray], shape) -> np.ndarray:
+        height, width = shape[:2]
+        if self._band_mask is None or self._band_mask.shape != (height, width):
+            self._band_mask = np.zeros((height, width), dtype=np.uint8)
+        else:
+            self._band_mask[:] = 0
+
+        for polygon in polygons:
+            cv2.fillPoly(self._band_mask, polygon, 255)
+        return self._band_mask
+
+    def detect_lane_lines(self, frame, mask: Optional[np.ndarray] = None) -> List[np.ndarray]:
+        context = FrameContext.of(frame)
+        edges = context.edges(50, 150)
+
+        if mask is None:
+            mask = self.lane_mask(edges.shape)
         masked_edges = cv2.bitwise_and(edges, mask)
 
         lines = cv2.HoughLinesP(
@@ -52,77 +89,82 @@ class AIDetector:
 
         return cv2.addWeighted(frame, 0.8, line_image, 1, 0)
 
-    def detect_vehicles(self, frame) -> List[Dict]:
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-
-        vehicles = []
+    def detect_vehicles(self, frame, regions: Optional[List[Tuple[int, int, int, int]]] = None) -> np.ndarray:
+        context = FrameContext.of(frame)
 
-        height, width = frame.shape[:2]
+        height, width = context.shape[:2]
         roi_y = height // 3
-        roi = gray[roi_y:, :]
 
-        blur = cv2.GaussianBlur(roi, (5, 5), 0)
-        edges = cv2.Canny(blur, 30, 100)
+        if regions is None:
+            return self._vehicle_candidates(context.edges(30, 100)[roi_y:, :], 0, roi_y)
+
+        vehicles = [np.zeros(0, dtype=VEHICLE_DTYPE)]
+        for x, y, w, h in regions:
+            x0, y0 = max(0, x), max(roi_y, y)
+            x1, y1 = min(width, x + w), min(height, y + h)
+            if x1 - x0 < 8 or y1 - y0 < 8:
+                continue
+            edges = context.edges_in(x0, y0, x1 - x0, y1 - y0, 30, 100)
+            vehicles.append(self._vehicle_candidates(edges, x0, y0))
 
+        return np.concatenate(vehicles)
+
+    def _vehicle_candidates(self, edges, offset_x: int, offset_y: int) -> np.ndarray:
         contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        stats = contour_stats(contours)
+
+        area = stats['area']
+        aspect_ratio = stats['w'] / stats['h'].astype(np.float32)
+        candidates = stats[(area > 1500) & (area < 20000) & (aspect_ratio > 0.8) & (aspect_ratio < 3.0)]
 
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            if 1500 < area < 20000:
-                x, y, w, h = cv2.boundingRect(contour)
-                aspect_ratio = w / float(h) if h > 0 else 0
-
-                if 0.8 < aspect_ratio < 3.0:
-                    vehicles.append({
-                        'x': x,
-                        'y': y + roi_y,
-                        'w': w,
-                        'h': h,
-                        'area': area,
-                        'confidence': min(area / 5000, 1.0)
-                    })
+        vehicles = np.empty(len(candidates), dtype=VEHICLE_DTYPE)
+        vehicles['x'] = candidates['x'] + offset_x
+        vehicles['y'] = candidates['y'] + offset_y
+        vehicles['w'] = candidates['w']
+        vehicles['h'] = candidates['h']
+        vehicles['area'] = candidates['area']
+        vehicles['confidence'] = np.minimum(candidates['area'] / 5000, 1.0)
 
         return vehicles
 
-    def draw_vehicle_detections(self, frame, vehicles: List[Dict]):
+    def draw_vehicle_detections(self, frame, vehicles):
         for vehicle in vehicles:
-            x, y, w, h = vehicle['x'], vehicle['y'], vehicle['w'], vehicle['h']
-            confidence = vehicle['confidence']
+            x, y, w, h = int(vehicle['x']), int(vehicle['y']), int(vehicle['w']), int(vehicle['h'])
+            confidence = float(vehicle['confidence'])
 
             color = (0, 255, 0) if confidence > 0.7 else (0, 165, 255)
 
             cv2.rectangle(frame, (x, y), (x + w, y + h), color, 2)
 
             label = f"Vehicle {int(confidence * 100)}%"
+            if isinstance(vehicle, dict) and 'track_id' in vehicle:
+                label = f"#{vehicle['track_id']} {label}"
             cv2.putText(frame, label, (x, y - 10), cv2.FONT_HERSHEY_SIMPLEX, 0.5, color, 2)
 
         return frame
 
     def check_blind_spot(self, frame, current_view: str) -> Dict:
-        height, width = frame.shape[:2]
+        if current_view not in ("left", "right"):
+            return {'warning': False, 'side': None}
 
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        context = FrameContext.of(frame)
+        height, width = context.shape[:2]
 
         if current_view == "left":
-            roi = gray[:, :width // 2]
+            edges = context.edges(50, 150)[:, :width // 2]
             side = "left"
-        elif current_view == "right":
-            roi = gray[:, width // 2:]
-            side = "right"
         else:
-            return {'warning': False, 'side': None}
-
-        blur = cv2.GaussianBlur(roi, (5, 5), 0)
-        edges = cv2.Canny(blur, 50, 150)
+            edges = context.edges(50, 150)[:, width // 2:]
+            side = "right"
 
         contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
 
-        large_objects = [c for c in contours if cv2.contourArea(c) > 3000]
+        large_objects = int(np.count_nonzero(contour_stats(contours)['area'] > 3000))
 
         return {
-            'warning': len(large_objects) > 0,
+            'warning': large_objects > 0,
             'side': side,
-            'object_count': len(large_objects)
+            'object_count': large_objects
         }
 
     def enable_detection(self, enabled: bool):
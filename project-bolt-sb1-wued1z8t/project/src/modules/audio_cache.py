@@ -0,0 +1,97 @@
+import hashlib
+import os
+import wave
+from typing import Dict, Iterable, Optional
+
+class CachedClip:
+    def __init__(self, data: bytes, channels: int, sample_width: int, sample_rate: int):
+        self.data = data
+        self.channels = channels
+        self.sample_width = sample_width
+        self.sample_rate = sample_rate
+
+class PhraseCache:
+    def __init__(self, directory: str = 'cache/voice'):
+        self.directory = directory
+        self.clips: Dict[str, CachedClip] = {}
+        self.player = None
+        self.hits = 0
+        self.misses = 0
+
+        try:
+            import simpleaudio
+            self.player = simpleaudio
+        except ImportError:
+            print("simpleaudio not installed; fixed phrases will be synthesized on demand")
+
+    @property
+    def enabled(self) -> bool:
+        return self.player is not None
+
+    @staticmethod
+    def key(text: str, voice: Optional[str], rate: int) -> str:
+        return hashlib.sha1(f"{voice}|{rate}|{text}".encode('utf-8')).hexdigest()
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.wav")
+
+    def get(self, text: str, voice: Optional[str], rate: int) -> Optional[CachedClip]:
+        if not self.enabled:
+            return None
+
+        key = self.key(text, voice, rate)
+        clip = self.clips.get(key)
+        if clip is None:
+            clip = self._load(key)
+
+        if clip is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return clip
+
+    def _load(self, key: str) -> Optional[CachedClip]:
+        path = self._path(key)
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with wave.open(path, 'rb') as handle:
+                clip = CachedClip(
+                    handle.readframes(handle.getnframes()),
+                    handle.getnchannels(),
+                    handle.getsampwidth(),
+                    handle.getframerate()
+                )
+        except (wave.Error, EOFError) as e:
+            print(f"Discarding unreadable voice clip {path}: {e}")
+            os.remove(path)
+            return None
+
+        if not clip.data:
+            return None
+        self.clips[key] = clip
+        return clip
+
+    def render(self, engine, phrases: Iterable[str], voice: Optional[str], rate: int) -> int:
+        if not self.enabled:
+            return 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        pending = {}
+        for text in phrases:
+            key = self.key(text, voice, rate)
+            if key not in self.clips and self._load(key) is None:
+                pending[key] = text
+
+        if not pending:
+            return 0
+
+        for key, text in pending.items():
+            engine.save_to_file(text, self._path(key))
+        engine.runAndWait()
+
+        return sum(1 for key in pending if self._load(key) is not None)
+
+    def play(self, clip: CachedClip):
+        return self.player.play_buffer(clip.data, clip.channels, clip.sample_width, clip.sample_rate)
@@ -0,0 +1,120 @@
+import cv2
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+def gated_sides(gate: Dict[str, Tuple[bool, np.ndarray]]) -> List[str]:
+    return [side for side, (analyse, _) in gate.items() if analyse]
+
+def check_sides(detector, context, sides: List[str]) -> Dict[str, Tuple[bool, int]]:
+    results = {}
+    for side in sides:
+        state = detector.check_blind_spot(context, side)
+        results[side] = (bool(state['warning']), int(state.get('object_count', 0)))
+    return results
+
+class SideState:
+    def __init__(self, side: str):
+        self.side = side
+        self.active = False
+        self.object_count = 0
+        self.positive_streak = 0
+        self.negative_streak = 0
+        self.updates_since_analysis = 0
+        self.previous: Optional[np.ndarray] = None
+        self.analyses = 0
+        self.gated = 0
+
+    def as_dict(self) -> Dict:
+        return {'warning': self.active, 'side': self.side, 'object_count': self.object_count}
+
+class BlindSpotMonitor:
+    SIDES = ("left", "right")
+
+    def __init__(self, scale: int = 4, pixel_threshold: int = 25, motion_fraction: float = 0.005,
+                 on_count: int = 2, off_count: int = 5, refresh_interval: int = 15):
+        self.scale = scale
+        self.pixel_threshold = pixel_threshold
+        self.motion_fraction = motion_fraction
+        self.on_count = on_count
+        self.off_count = off_count
+        self.refresh_interval = refresh_interval
+        self.sides = {side: SideState(side) for side in self.SIDES}
+
+    def update(self, context, detector) -> Dict[str, Dict]:
+        gate = self.gate(context)
+        self.commit_gate(gate)
+        return self.apply(check_sides(detector, context, gated_sides(gate)))
+
+    def gate(self, context) -> Dict[str, Tuple[bool, np.ndarray]]:
+        small = context.small_gray(self.scale)
+        half = small.shape[1] // 2
+        regions = {"left": small[:, :half], "right": small[:, half:]}
+
+        gate = {}
+        for side, state in self.sides.items():
+            region = regions[side]
+            moving = self._has_motion(state, region)
+            settled = not state.active and state.positive_streak == 0
+            due = state.updates_since_analysis + 1 >= self.refresh_interval
+            gate[side] = (moving or not settled or due, region)
+        return gate
+
+    def commit_gate(self, gate: Dict[str, Tuple[bool, np.ndarray]]):
+        for side, (analyse, region) in gate.items():
+            state = self.sides[side]
+            if state.previous is None or state.previous.shape != region.shape:
+                state.previous = region.copy()
+            else:
+                np.copyto(state.previous, region)
+
+            if analyse:
+                state.updates_since_analysis = 0
+            else:
+                state.updates_since_analysis += 1
+                state.gated += 1
+
+    def apply(self, results: Dict[str, Tuple[bool, int]]) -> Dict[str, Dict]:
+        for side, (detected, object_count) in results.items():
+            state = self.sides[side]
+            state.analyses += 1
+            self._apply(state, detected, object_count)
+        return self.states()
+
+    def _has_motion(self, state: SideState, region: np.ndarray) -> bool:
+        previous = state.previous
+        if previous is None or previous.shape != region.shape:
+            return True
+
+        diff = cv2.absdiff(region, previous)
+        changed = np.count_nonzero(diff > self.pixel_threshold)
+        return changed > self.motion_fraction * diff.size
+
+    def _apply(self, state: SideState, detected: bool, object_count: int):
+        if detected:
+            state.positive_streak += 1
+            state.negative_streak = 0
+            if state.positive_streak >= self.on_count:
+                state.active = True
+            if state.active:
+                state.object_count = object_count
+        else:
+            state.negative_streak += 1
+            state.positive_streak = 0
+            if state.negative_streak >= self.off_count:
+                state.active = False
+                state.object_count = 0
+
+    def states(self) -> Dict[str, Dict]:
+        return {side: state.as_dict() for side, state in self.sides.items()}
+
+    def state_for(self, view: str) -> Dict:
+        if view not in self.sides:
+            return {'warning': False, 'side': None}
+        return self.sides[view].as_dict()
+
+    def is_active(self, side: str) -> bool:
+        state = self.sides.get(side)
+        return state is not None and state.active
+
+    def reset(self):
+        self.sides = {side: SideState(side) for side in self.SIDES}
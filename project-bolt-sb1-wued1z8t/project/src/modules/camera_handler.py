@@ -1,104 +1,147 @@
 import cv2
 import threading
+import time
 import numpy as np
 from typing import Optional, Callable
+from modules.frame_context import FrameContext
+from modules.frame_ring import FrameRing, FramePacket
+from modules.overlay_sprite import OverlaySprite
+from modules.contour_filter import contour_stats, CONTOUR_DTYPE
+from modules.metrics import metrics
+
+OBJECT_DTYPE = np.dtype(CONTOUR_DTYPE.descr + [('position', 'U6')])
 
 class CameraHandler:
-    def __init__(self):
+    VIEW_OVERLAYS = {
+        "left": ("LEFT CAMERA", (0, 255, 170)),
+        "right": ("RIGHT CAMERA", (255, 107, 0)),
+        "rear": ("REAR CAMERA", (0, 123, 255)),
+        "center": ("CENTER VIEW", (255, 255, 255)),
+    }
+
+    def __init__(self, buffer_size: int = 4):
         self.cap: Optional[cv2.VideoCapture] = None
         self.current_view = "center"
         self.is_running = False
-        self.frame = None
+        self.frames = FrameRing(buffer_size)
         self.frame_callback: Optional[Callable] = None
+        self.overlay_sprite: Optional[OverlaySprite] = None
         self.lock = threading.Lock()
+        self.capture_thread: Optional[threading.Thread] = None
 
-    def start_camera(self, camera_index: int = 0):
-        if self.cap is None or not self.cap.isOpened():
+    def start_camera(self, camera_index: int = 0, source=None):
+        if source is not None:
+            self.cap = source
+        elif self.cap is None or not self.cap.isOpened():
             self.cap = cv2.VideoCapture(camera_index)
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, 640)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 480)
 
         self.is_running = True
-        threading.Thread(target=self._capture_loop, daemon=True).start()
+        self.capture_thread = threading.Thread(target=self._capture_loop, args=(self.cap,), daemon=True)
+        self.capture_thread.start()
+
+    def _capture_loop(self, cap):
+        retry_delay = 0.0
+
+        try:
+            while self.is_running:
+                with metrics.timer('capture'):
+                    ret, frame = cap.read()
+                metrics.tick('capture_loop')
+
+                if not ret:
+                    if getattr(cap, 'finished', False):
+                        print("Camera source reached the end")
+                        break
+                    retry_delay = min(max(retry_delay * 2, 0.01), 1.0)
+                    time.sleep(retry_delay)
+                    continue
+                retry_delay = 0.0
+
+                timestamp = time.monotonic()
 
-    def _capture_loop(self):
-        while self.is_running and self.cap is not None:
-            ret, frame = self.cap.read()
-            if ret:
                 with self.lock:
-                    self.frame = self._process_frame(frame)
+                    slot = self.frames.acquire(frame.shape, frame.dtype)
+                    with metrics.timer('overlay'):
+                        self._process_frame(frame, slot)
 
-                if self.frame_callback:
-                    self.frame_callback(self.frame)
+                self.frames.commit(timestamp)
 
-    def _process_frame(self, frame):
-        frame = cv2.flip(frame, 1)
+                if self.frame_callback:
+                    self.frame_callback(self.frames.latest())
+        finally:
+            cap.release()
+            if self.cap is cap:
+                self.cap = None
+                self.is_running = False
 
-        if self.current_view == "left":
-            frame = self._add_overlay(frame, "LEFT CAMERA", (0, 255, 170))
-        elif self.current_view == "right":
-            frame = self._add_overlay(frame, "RIGHT CAMERA", (255, 107, 0))
-        elif self.current_view == "rear":
-            frame = self._add_overlay(frame, "REAR CAMERA", (0, 123, 255))
-        else:
-            frame = self._add_overlay(frame, "CENTER VIEW", (255, 255, 255))
+    def _process_frame(self, frame, out: Optional[np.ndarray] = None):
+        frame = cv2.flip(frame, 1, dst=out)
 
-        return frame
+        text, color = self.VIEW_OVERLAYS.get(self.current_view, self.VIEW_OVERLAYS["center"])
+        return self._add_overlay(frame, text, color)
 
     def _add_overlay(self, frame, text: str, color: tuple):
         height, width = frame.shape[:2]
 
-        overlay = frame.copy()
-        cv2.rectangle(overlay, (0, 0), (width, 60), (10, 10, 10), -1)
-        frame = cv2.addWeighted(overlay, 0.7, frame, 0.3, 0)
+        sprite = self.overlay_sprite
+        if sprite is None or sprite.key != (text, color, width, height):
+            sprite = OverlaySprite(text, color, width, height)
+            self.overlay_sprite = sprite
 
-        cv2.putText(frame, text, (20, 40), cv2.FONT_HERSHEY_BOLD, 1.2, color, 2)
-
-        cv2.circle(frame, (width - 30, 30), 8, (0, 0, 255), -1)
-        cv2.putText(frame, "REC", (width - 80, 38), cv2.FONT_HERSHEY_SIMPLEX, 0.6, (255, 255, 255), 2)
-
-        return frame
+        return sprite.blend_into(frame)
 
     def switch_view(self, view: str):
         with self.lock:
             self.current_view = view
+            self.overlay_sprite = None
 
     def get_current_frame(self):
-        with self.lock:
-            return self.frame.copy() if self.frame is not None else None
+        packet = self.frames.latest()
+        return packet.frame if packet is not None else None
+
+    def read_frame(self, after_sequence: int = 0) -> Optional[FramePacket]:
+        return self.frames.read_after(after_sequence)
+
+    def wait_for_frame(self, after_sequence: int = 0, timeout: Optional[float] = None) -> Optional[FramePacket]:
+        return self.frames.wait_after(after_sequence, timeout)
 
     def set_frame_callback(self, callback: Callable):
         self.frame_callback = callback
 
-    def stop_camera(self):
+    def stop_camera(self, timeout: float = 2.0):
         self.is_running = False
-        if self.cap is not None:
-            self.cap.release()
-            self.cap = None
 
-    def detect_objects(self, frame):
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        blur = cv2.GaussianBlur(gray, (5, 5), 0)
-        edges = cv2.Canny(blur, 50, 150)
+        thread = self.capture_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+            if thread.is_alive():
+                print(f"Camera capture did not stop within {timeout:.1f} s")
+        self.capture_thread = None
+
+    def detect_objects(self, frame) -> np.ndarray:
+        context = FrameContext.of(frame)
+        width = context.shape[1]
+        edges = context.edges(50, 150)
 
         contours, _ = cv2.findContours(edges, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        stats = contour_stats(contours)
+        stats = stats[stats['area'] > 1000]
 
-        detected_objects = []
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            if area > 1000:
-                x, y, w, h = cv2.boundingRect(contour)
-                detected_objects.append({
-                    'x': x, 'y': y, 'w': w, 'h': h,
-                    'area': area,
-                    'position': 'left' if x < frame.shape[1] // 3 else 'right' if x > 2 * frame.shape[1] // 3 else 'center'
-                })
+        detected_objects = np.empty(len(stats), dtype=OBJECT_DTYPE)
+        for field in ('x', 'y', 'w', 'h', 'area'):
+            detected_objects[field] = stats[field]
+        detected_objects['position'] = np.where(
+            stats['x'] < width // 3, 'left',
+            np.where(stats['x'] > 2 * width // 3, 'right', 'center')
+        )
 
         return detected_objects
 
-    def draw_detections(self, frame, objects: list, show_warnings: bool = True):
+    def draw_detections(self, frame, objects, show_warnings: bool = True):
         for obj in objects:
-            x, y, w, h = obj['x'], obj['y'], obj['w'], obj['h']
+            x, y, w, h = int(obj['x']), int(obj['y']), int(obj['w']), int(obj['h'])
 
             color = (0, 255, 0)
             if show_warnings and obj['area'] > 5000:
@@ -0,0 +1,34 @@
+import numpy as np
+from typing import Sequence
+
+CONTOUR_DTYPE = np.dtype([
+    ('x', np.int32), ('y', np.int32), ('w', np.int32), ('h', np.int32), ('area', np.float32)
+])
+
+def contour_stats(contours: Sequence[np.ndarray]) -> np.ndarray:
+    count = len(contours)
+    stats = np.zeros(count, dtype=CONTOUR_DTYPE)
+    if count == 0:
+        return stats
+
+    lengths = np.fromiter(map(len, contours), dtype=np.intp, count=count)
+    points = np.concatenate(contours).reshape(-1, 2).astype(np.int64)
+    x, y = points[:, 0], points[:, 1]
+
+    starts = np.zeros(count, dtype=np.intp)
+    np.cumsum(lengths[:-1], out=starts[1:])
+    ends = starts + lengths
+
+    following = np.arange(1, len(points) + 1)
+    following[ends - 1] = starts
+    cross = x * y[following] - x[following] * y
+    stats['area'] = np.abs(np.add.reduceat(cross, starts)) / 2.0
+
+    x_min = np.minimum.reduceat(x, starts)
+    y_min = np.minimum.reduceat(y, starts)
+    stats['x'] = x_min
+    stats['y'] = y_min
+    stats['w'] = np.maximum.reduceat(x, starts) - x_min + 1
+    stats['h'] = np.maximum.reduceat(y, starts) - y_min + 1
+
+    return stats
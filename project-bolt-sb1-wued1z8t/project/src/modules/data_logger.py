@@ -1,12 +1,31 @@
 import os
 from datetime import datetime
-from typing import Optional
-from supabase import create_client, Client
+from typing import Dict, Optional
+from modules.log_writer import BatchLogWriter
+from modules.log_store import LocalLogStore, LogReplayer
+from modules.log_coalescer import EventCoalescer
 
 class DataLogger:
-    def __init__(self):
-        self.supabase: Optional[Client] = None
-        self._initialize_supabase()
+    def __init__(self, client=None, store_path: Optional[str] = None, coalesce_window: float = 5.0,
+                 writer_options: Optional[Dict] = None, replayer_options: Optional[Dict] = None):
+        self.supabase = client
+        self.writer: Optional[BatchLogWriter] = None
+        self.store: Optional[LocalLogStore] = None
+        self.replayer: Optional[LogReplayer] = None
+        self.coalescer: Optional[EventCoalescer] = None
+
+        if coalesce_window > 0:
+            self.coalescer = EventCoalescer(self.log_event, coalesce_window)
+
+        if self.supabase is None:
+            self._initialize_supabase()
+
+        self._initialize_store(store_path or os.getenv('SYSTEM_LOG_STORE', 'logs/system_logs.db'))
+
+        if self.store is not None:
+            self.replayer = LogReplayer(self.store, self.supabase, **(replayer_options or {}))
+        elif self.supabase is not None:
+            self.writer = BatchLogWriter(self.supabase, **(writer_options or {}))
 
     def _initialize_supabase(self):
         try:
@@ -14,6 +33,7 @@ class DataLogger:
             supabase_key = os.getenv('VITE_SUPABASE_ANON_KEY', '')
 
             if supabase_url and supabase_key:
+                from supabase import create_client
                 self.supabase = create_client(supabase_url, supabase_key)
                 print("Supabase connection initialized")
             else:
@@ -22,6 +42,16 @@ class DataLogger:
             print(f"Supabase initialization failed: {e}")
             self.supabase = None
 
+    def _initialize_store(self, store_path: str):
+        try:
+            self.store = LocalLogStore(store_path)
+            pending = self.store.unsent_count()
+            if pending:
+                print(f"Local log store has {pending} unsent entries")
+        except Exception as e:
+            print(f"Local log store unavailable, using in-memory queue: {e}")
+            self.store = None
+
     def log_event(self, event_type: str, details: str, camera_view: str = None):
         timestamp = datetime.now().isoformat()
 
@@ -34,11 +64,42 @@ class DataLogger:
 
         print(f"[LOG] {timestamp} | {event_type} | {details} | View: {camera_view}")
 
-        if self.supabase:
+        if self.store:
             try:
-                self.supabase.table('system_logs').insert(log_entry).execute()
+                self.store.append(log_entry)
+                if self.replayer:
+                    self.replayer.notify()
+                return
             except Exception as e:
-                print(f"Failed to log to Supabase: {e}")
+                print(f"Failed to write local log store: {e}")
+
+        if self.writer and not self.writer.submit(log_entry):
+            print(f"Log queue full, dropped {event_type} event")
+
+    def queue_depth(self) -> int:
+        if self.replayer and self.store and self.supabase is not None:
+            return self.store.unsent_count()
+        if self.writer:
+            return self.writer.queue_depth()
+        return 0
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        if self.replayer:
+            return self.replayer.flush(timeout)
+        if self.writer:
+            return self.writer.flush(timeout)
+        return True
+
+    def stop(self, timeout: float = 5.0):
+        if self.coalescer:
+            self.coalescer.stop()
+        if self.replayer:
+            self.replayer.stop(timeout)
+        if self.writer:
+            self.writer.stop(timeout)
+        if self.store:
+            self.store.close()
+            self.store = None
 
     def log_indicator_change(self, direction: str, state: str):
         self.log_event(
@@ -55,18 +116,20 @@ class DataLogger:
         )
 
     def log_ai_detection(self, detection_type: str, count: int, view: str):
-        self.log_event(
-            event_type='AI_DETECTION',
-            details=f'{detection_type}: {count} objects detected',
-            camera_view=view
-        )
+        details = f'{detection_type}: {count} objects detected'
+
+        if self.coalescer:
+            self.coalescer.record('AI_DETECTION', detection_type, details, view, count)
+        else:
+            self.log_event(event_type='AI_DETECTION', details=details, camera_view=view)
 
     def log_warning(self, warning_type: str, severity: str = 'MEDIUM'):
-        self.log_event(
-            event_type='WARNING',
-            details=f'{severity} - {warning_type}',
-            camera_view=None
-        )
+        details = f'{severity} - {warning_type}'
+
+        if self.coalescer:
+            self.coalescer.record('WARNING', details, details)
+        else:
+            self.log_event(event_type='WARNING', details=details, camera_view=None)
 
     def log_system_event(self, event_description: str):
         self.log_event(
@@ -0,0 +1,99 @@
+import time
+from typing import Dict, List, Optional
+
+class DetectorSchedule:
+    def __init__(self, name: str, target_hz: float, budget_ms: float, priority: float = 1.0):
+        self.name = name
+        self.base_hz = target_hz
+        self.target_hz = target_hz
+        self.budget_ms = budget_ms
+        self.base_priority = priority
+        self.priority = priority
+        self.cost_ms = budget_ms
+        self.last_run = 0.0
+        self.runs = 0
+        self.skipped = 0
+
+    def interval(self) -> float:
+        return 1.0 / self.target_hz if self.target_hz > 0 else float('inf')
+
+    def overdue(self, now: float) -> float:
+        return (now - self.last_run) / self.interval()
+
+class DetectionScheduler:
+    FULL_RATE_HZ = 1000.0
+
+    def __init__(self, frame_budget_ms: float = 15.0, smoothing: float = 0.2):
+        self.frame_budget_ms = frame_budget_ms
+        self.smoothing = smoothing
+        self.detectors: Dict[str, DetectorSchedule] = {
+            'lanes': DetectorSchedule('lanes', 10.0, 6.0, priority=1.0),
+            'vehicles': DetectorSchedule('vehicles', 15.0, 6.0, priority=1.5),
+            'blind_spot': DetectorSchedule('blind_spot', 5.0, 3.0, priority=1.0),
+        }
+
+    def update_context(self, view: str, reverse: bool = False, speed: float = 0.0):
+        lanes = self.detectors['lanes']
+        vehicles = self.detectors['vehicles']
+        blind_spot = self.detectors['blind_spot']
+
+        for detector in self.detectors.values():
+            detector.target_hz = detector.base_hz
+            detector.priority = detector.base_priority
+
+        if view in ("left", "right"):
+            blind_spot.target_hz = self.FULL_RATE_HZ
+            blind_spot.priority = 3.0
+            lanes.target_hz = lanes.base_hz / 2
+
+        if reverse:
+            vehicles.priority = 3.0
+            lanes.target_hz = 2.0
+            lanes.priority = 0.5
+        elif speed > 60:
+            lanes.target_hz = lanes.base_hz * 1.5
+            lanes.priority = 2.0
+
+    def plan(self, now: Optional[float] = None) -> List[str]:
+        now = time.monotonic() if now is None else now
+
+        due = [d for d in self.detectors.values() if d.overdue(now) >= 1.0]
+        due.sort(key=lambda d: d.priority * min(d.overdue(now), 4.0), reverse=True)
+
+        planned = []
+        spent = 0.0
+        for detector in due:
+            cost = min(detector.cost_ms, detector.budget_ms * 4)
+            starving = detector.overdue(now) >= 3.0
+            if spent + cost <= self.frame_budget_ms or not planned and starving:
+                planned.append(detector.name)
+                spent += cost
+            else:
+                detector.skipped += 1
+
+        return planned
+
+    def record(self, name: str, elapsed_ms: float, now: Optional[float] = None):
+        self.dispatch([name], now)
+        self.record_cost(name, elapsed_ms)
+
+    def dispatch(self, names: List[str], now: Optional[float] = None):
+        now = time.monotonic() if now is None else now
+        for name in names:
+            self.detectors[name].last_run = now
+
+    def record_cost(self, name: str, elapsed_ms: float):
+        detector = self.detectors[name]
+        detector.runs += 1
+        detector.cost_ms += self.smoothing * (elapsed_ms - detector.cost_ms)
+
+    def stats(self) -> Dict[str, Dict]:
+        return {
+            name: {
+                'target_hz': d.target_hz,
+                'cost_ms': d.cost_ms,
+                'runs': d.runs,
+                'skipped': d.skipped,
+            }
+            for name, d in self.detectors.items()
+        }
@@ -0,0 +1,154 @@
+import multiprocessing as mp
+import time
+import numpy as np
+from multiprocessing import shared_memory
+from queue import Empty
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from modules.ai_detector import VEHICLE_DTYPE
+from modules.blind_spot_monitor import check_sides
+
+class DetectionResult(NamedTuple):
+    sequence: int
+    lines: Optional[np.ndarray]
+    vehicles: Optional[np.ndarray]
+    blind_spot: Optional[Dict[str, Tuple[bool, int]]]
+    timings: Dict[str, float]
+    requests: Dict[str, object]
+
+def run_detectors(detector, context, requests: Dict[str, object]) -> DetectionResult:
+    lines = vehicles = blind_spot = None
+    timings = {}
+
+    for name, request in requests.items():
+        started = time.perf_counter()
+        if name == 'lanes':
+            mask = detector.band_mask(request, context.shape) if request is not None else None
+            lines = np.asarray(detector.detect_lane_lines(context, mask), dtype=np.int32).reshape(-1, 1, 4)
+        elif name == 'vehicles':
+            vehicles = np.asarray(detector.detect_vehicles(context, request), dtype=VEHICLE_DTYPE)
+        elif name == 'blind_spot':
+            blind_spot = check_sides(detector, context, request)
+        timings[name] = (time.perf_counter() - started) * 1000
+
+    return DetectionResult(context.sequence, lines, vehicles, blind_spot, timings, requests)
+
+def _detection_worker(task_queue, result_queue, slot_names: List[str]):
+    from modules.ai_detector import AIDetector
+    from modules.frame_context import FrameContext
+
+    detector = AIDetector()
+    slots = [shared_memory.SharedMemory(name=name) for name in slot_names]
+
+    try:
+        while True:
+            task = task_queue.get()
+            if task is None:
+                break
+
+            slot_index, sequence, shape, requests = task
+            frame = np.ndarray(shape, dtype=np.uint8, buffer=slots[slot_index].buf)
+            context = FrameContext(frame, sequence)
+
+            result = error = None
+            try:
+                result = run_detectors(detector, context, requests)
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                print(f"Detection worker error on frame {sequence}: {error}")
+
+            del context, frame
+            result_queue.put((slot_index, sequence, result, error))
+    finally:
+        for slot in slots:
+            slot.close()
+
+class DetectionPool:
+    def __init__(self, num_workers: int = 2, slots_per_worker: int = 2,
+                 max_frame_bytes: int = 1920 * 1080 * 3):
+        self.num_workers = num_workers
+        self.max_frame_bytes = max_frame_bytes
+        self.slots = [
+            shared_memory.SharedMemory(create=True, size=max_frame_bytes)
+            for _ in range(num_workers * slots_per_worker)
+        ]
+        self.free_slots = list(range(len(self.slots)))
+        self.results: List[DetectionResult] = []
+        self.pending: Set[int] = set()
+        self.discarded: Set[int] = set()
+        self.submitted = 0
+        self.skipped = 0
+        self.failed = 0
+
+        context = mp.get_context('spawn')
+        self.task_queue = context.Queue()
+        self.result_queue = context.Queue()
+        self.workers = [
+            context.Process(
+                target=_detection_worker,
+                args=(self.task_queue, self.result_queue, [slot.name for slot in self.slots]),
+                daemon=True
+            )
+            for _ in range(num_workers)
+        ]
+        for worker in self.workers:
+            worker.start()
+
+    def submit(self, frame: np.ndarray, sequence: int, requests: Dict[str, object]) -> bool:
+        self._collect()
+
+        if not self.free_slots or frame.nbytes > self.max_frame_bytes:
+            self.skipped += 1
+            return False
+
+        slot_index = self.free_slots.pop()
+        target = np.ndarray(frame.shape, dtype=np.uint8, buffer=self.slots[slot_index].buf)
+        np.copyto(target, frame)
+        del target
+
+        self.task_queue.put((slot_index, sequence, frame.shape, requests))
+        self.pending.add(sequence)
+        self.submitted += 1
+        return True
+
+    def _collect(self):
+        while True:
+            try:
+                slot_index, sequence, result, error = self.result_queue.get_nowait()
+            except Empty:
+                return
+
+            self.free_slots.append(slot_index)
+            self.pending.discard(sequence)
+            if error is not None:
+                self.failed += 1
+            if sequence in self.discarded:
+                self.discarded.remove(sequence)
+                continue
+            if result is not None:
+                self.results.append(result)
+
+    def discard(self, sequence: int):
+        if sequence in self.pending:
+            self.discarded.add(sequence)
+        self.results = [result for result in self.results if result.sequence != sequence]
+
+    def take_results(self) -> List[DetectionResult]:
+        self._collect()
+        results, self.results = self.results, []
+        return sorted(results, key=lambda result: result.sequence)
+
+    def in_flight(self) -> int:
+        return len(self.slots) - len(self.free_slots)
+
+    def stop(self, timeout: float = 2.0):
+        for _ in self.workers:
+            self.task_queue.put(None)
+
+        for worker in self.workers:
+            worker.join(timeout)
+            if worker.is_alive():
+                worker.terminate()
+
+        for slot in self.slots:
+            slot.close()
+            slot.unlink()
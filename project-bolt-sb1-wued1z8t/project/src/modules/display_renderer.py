@@ -0,0 +1,101 @@
+import cv2
+import threading
+import numpy as np
+from PIL import Image, ImageTk
+from typing import List, Optional, Tuple
+from modules.metrics import metrics
+
+class DisplayRenderer:
+    def __init__(self, widget, default_size: Tuple[int, int] = (1040, 650), buffers: int = 3):
+        self.widget = widget
+        self.default_size = default_size
+        self.bounds = default_size
+        self.photo: Optional[ImageTk.PhotoImage] = None
+        self.lock = threading.Lock()
+        self._rgb: List[Optional[np.ndarray]] = [None] * buffers
+        self._images: List[Optional[Image.Image]] = [None] * buffers
+        self._front = 0
+        self._ready: Optional[int] = None
+        self._scaled: Optional[np.ndarray] = None
+
+    def target_size(self) -> Tuple[int, int]:
+        width = self.widget.winfo_width()
+        height = self.widget.winfo_height()
+
+        if width <= 1 or height <= 1:
+            return self.default_size
+        return (width, height)
+
+    def fit_size(self, frame_size: Tuple[int, int], bounds: Tuple[int, int]) -> Tuple[Tuple[int, int], float]:
+        frame_width, frame_height = frame_size
+        scale = min(bounds[0] / frame_width, bounds[1] / frame_height)
+        size = (max(1, int(frame_width * scale)), max(1, int(frame_height * scale)))
+        return size, scale
+
+    def _interpolation(self, scale: float) -> int:
+        if scale < 1.0:
+            return cv2.INTER_AREA
+        return cv2.INTER_LINEAR
+
+    def _buffer(self, current: Optional[np.ndarray], shape: Tuple[int, ...]) -> np.ndarray:
+        if current is None or current.shape != shape:
+            return np.empty(shape, dtype=np.uint8)
+        return current
+
+    def render(self, frame: np.ndarray) -> bool:
+        with metrics.timer('display_convert'):
+            self.prepare(frame, self.target_size())
+        with metrics.timer('tk_update'):
+            return self.present()
+
+    def prepare(self, frame: np.ndarray, bounds: Optional[Tuple[int, int]] = None) -> Tuple[int, int]:
+        height, width = frame.shape[:2]
+        size, scale = self.fit_size((width, height), bounds or self.bounds)
+        out_shape = (size[1], size[0], 3)
+
+        with self.lock:
+            index = next(i for i in range(len(self._rgb)) if i != self._front and i != self._ready)
+        rgb = self._rgb[index] = self._buffer(self._rgb[index], out_shape)
+
+        if size == (width, height):
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb)
+        elif scale > 1.0:
+            self._scaled = self._buffer(self._scaled, (height, width, 3))
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self._scaled)
+            cv2.resize(self._scaled, size, dst=rgb, interpolation=self._interpolation(scale))
+        else:
+            self._scaled = self._buffer(self._scaled, out_shape)
+            cv2.resize(frame, size, dst=self._scaled, interpolation=self._interpolation(scale))
+            cv2.cvtColor(self._scaled, cv2.COLOR_BGR2RGB, dst=rgb)
+
+        with self.lock:
+            self._ready = index
+        return size
+
+    def discard(self):
+        with self.lock:
+            self._ready = None
+
+    def present(self) -> bool:
+        self.bounds = self.target_size()
+
+        with self.lock:
+            if self._ready is None:
+                return False
+            self._front, self._ready = self._ready, None
+            index = self._front
+
+        rgb = self._rgb[index]
+        size = (rgb.shape[1], rgb.shape[0])
+        image = self._images[index]
+        if image is None or image.size != size:
+            image = self._images[index] = Image.frombuffer('RGB', size, rgb, 'raw', 'RGB', 0, 1)
+
+        if self.photo is None or (self.photo.width(), self.photo.height()) != size:
+            self.photo = ImageTk.PhotoImage(image=image)
+            self.widget.configure(image=self.photo)
+            self.widget.image = self.photo
+            return True
+
+        self.photo.paste(image)
+        return False
@@ -0,0 +1,113 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, NamedTuple, Tuple, Type
+from modules.metrics import metrics
+
+class IndicatorChanged(NamedTuple):
+    side: str
+    active: bool
+
+class ReverseChanged(NamedTuple):
+    engaged: bool
+
+class AIToggled(NamedTuple):
+    enabled: bool
+
+class Subscriber:
+    def __init__(self, name: str, max_queue: int = 100):
+        self.name = name
+        self.max_queue = max_queue
+        self.handlers: Dict[Type, Callable] = {}
+        self.pending: Deque[Tuple[float, object]] = deque()
+        self.condition = threading.Condition()
+        self.is_running = True
+
+        self.handled = 0
+        self.dropped = 0
+        self.errors = 0
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+
+        self.thread = threading.Thread(target=self._dispatch_loop, name=f"bus-{name}", daemon=True)
+        self.thread.start()
+
+    def deliver(self, event, published: float):
+        with self.condition:
+            if len(self.pending) >= self.max_queue:
+                self.pending.popleft()
+                self.dropped += 1
+            self.pending.append((published, event))
+            self.condition.notify()
+
+    def _dispatch_loop(self):
+        while True:
+            with self.condition:
+                while self.is_running and not self.pending:
+                    self.condition.wait()
+                if not self.pending:
+                    return
+                published, event = self.pending.popleft()
+
+            lag_ms = (time.monotonic() - published) * 1000.0
+            self.last_lag_ms = lag_ms
+            self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+            metrics.observe(f'bus_lag_{self.name}', lag_ms)
+
+            try:
+                self.handlers[type(event)](event)
+                self.handled += 1
+            except Exception as e:
+                self.errors += 1
+                print(f"Event handler {self.name} failed on {type(event).__name__}: {e}")
+
+    def queue_depth(self) -> int:
+        with self.condition:
+            return len(self.pending)
+
+    def stop(self, timeout: float = 1.0):
+        with self.condition:
+            self.is_running = False
+            self.condition.notify()
+        self.thread.join(timeout)
+
+class EventBus:
+    def __init__(self, max_queue: int = 100):
+        self.max_queue = max_queue
+        self.subscribers: Dict[str, Subscriber] = {}
+        self.routes: Dict[Type, List[Subscriber]] = {}
+        self.lock = threading.Lock()
+        self.published = 0
+
+    def subscribe(self, name: str, event_type: Type, handler: Callable):
+        with self.lock:
+            subscriber = self.subscribers.get(name)
+            if subscriber is None:
+                subscriber = self.subscribers[name] = Subscriber(name, self.max_queue)
+            subscriber.handlers[event_type] = handler
+            routed = self.routes.get(event_type, [])
+            if subscriber not in routed:
+                self.routes[event_type] = routed + [subscriber]
+
+    def publish(self, event):
+        published = time.monotonic()
+        self.published += 1
+        for subscriber in self.routes.get(type(event), ()):
+            subscriber.deliver(event, published)
+
+    def stats(self) -> Dict[str, Dict]:
+        return {
+            name: {
+                'queue_depth': subscriber.queue_depth(),
+                'handled': subscriber.handled,
+                'dropped': subscriber.dropped,
+                'errors': subscriber.errors,
+                'last_lag_ms': subscriber.last_lag_ms,
+                'max_lag_ms': subscriber.max_lag_ms
+            }
+            for name, subscriber in self.subscribers.items()
+        }
+
+    def stop(self, timeout: float = 1.0):
+        for subscriber in list(self.subscribers.values()):
+            subscriber.stop(timeout)
@@ -0,0 +1,58 @@
+import cv2
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+class FrameContext:
+    def __init__(self, frame: np.ndarray, sequence: Optional[int] = None):
+        self.frame = frame
+        self.sequence = sequence
+        self._gray: Optional[np.ndarray] = None
+        self._small_gray: Dict[int, np.ndarray] = {}
+        self._blur: Dict[Tuple[int, int], np.ndarray] = {}
+        self._edges: Dict[Tuple[Tuple[int, int], int, int], np.ndarray] = {}
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        return self.frame.shape
+
+    def gray(self) -> np.ndarray:
+        if self._gray is None:
+            self._gray = cv2.cvtColor(self.frame, cv2.COLOR_BGR2GRAY)
+        return self._gray
+
+    def small_gray(self, factor: int = 4) -> np.ndarray:
+        small = self._small_gray.get(factor)
+        if small is None:
+            gray = self.gray()
+            size = (max(1, gray.shape[1] // factor), max(1, gray.shape[0] // factor))
+            small = cv2.resize(gray, size, interpolation=cv2.INTER_AREA)
+            self._small_gray[factor] = small
+        return small
+
+    def blur(self, ksize: Tuple[int, int] = (5, 5)) -> np.ndarray:
+        blurred = self._blur.get(ksize)
+        if blurred is None:
+            blurred = cv2.GaussianBlur(self.gray(), ksize, 0)
+            self._blur[ksize] = blurred
+        return blurred
+
+    def edges(self, low: int = 50, high: int = 150, ksize: Tuple[int, int] = (5, 5)) -> np.ndarray:
+        key = (ksize, low, high)
+        edge_map = self._edges.get(key)
+        if edge_map is None:
+            edge_map = cv2.Canny(self.blur(ksize), low, high)
+            self._edges[key] = edge_map
+        return edge_map
+
+    def edges_in(self, x: int, y: int, w: int, h: int, low: int = 50, high: int = 150,
+                 ksize: Tuple[int, int] = (5, 5)) -> np.ndarray:
+        edge_map = self._edges.get((ksize, low, high))
+        if edge_map is not None:
+            return edge_map[y:y + h, x:x + w]
+        return cv2.Canny(self.blur(ksize)[y:y + h, x:x + w], low, high)
+
+    @staticmethod
+    def of(frame, sequence: Optional[int] = None) -> 'FrameContext':
+        if isinstance(frame, FrameContext):
+            return frame
+        return FrameContext(frame, sequence)
@@ -0,0 +1,77 @@
+import threading
+import numpy as np
+from typing import NamedTuple, Optional, Tuple
+
+class FramePacket(NamedTuple):
+    frame: np.ndarray
+    sequence: int
+    timestamp: float
+
+class FrameRing:
+    def __init__(self, size: int = 4):
+        if size < 2:
+            raise ValueError("FrameRing needs at least two slots")
+
+        self.size = size
+        self.lock = threading.Lock()
+        self.new_frame = threading.Condition(self.lock)
+        self._slots: Optional[np.ndarray] = None
+        self._views = []
+        self._sequences = [0] * size
+        self._timestamps = [0.0] * size
+        self._latest = 0
+
+    def acquire(self, shape: Tuple[int, ...], dtype=np.uint8) -> np.ndarray:
+        if self._slots is None or self._slots.shape[1:] != tuple(shape) or self._slots.dtype != dtype:
+            self._allocate(tuple(shape), dtype)
+
+        return self._slots[(self._latest + 1) % self.size]
+
+    def _allocate(self, shape: Tuple[int, ...], dtype):
+        slots = np.empty((self.size,) + shape, dtype=dtype)
+        views = []
+        for index in range(self.size):
+            view = slots[index].view()
+            view.flags.writeable = False
+            views.append(view)
+
+        with self.lock:
+            self._slots = slots
+            self._views = views
+            self._sequences = [0] * self.size
+            self._timestamps = [0.0] * self.size
+
+    def commit(self, timestamp: float) -> int:
+        with self.lock:
+            self._latest += 1
+            index = self._latest % self.size
+            self._sequences[index] = self._latest
+            self._timestamps[index] = timestamp
+            self.new_frame.notify_all()
+            return self._latest
+
+    def latest(self) -> Optional[FramePacket]:
+        with self.lock:
+            index = self._latest % self.size
+            if self._latest == 0 or self._sequences[index] != self._latest:
+                return None
+            return FramePacket(self._views[index], self._latest, self._timestamps[index])
+
+    def read_after(self, sequence: int) -> Optional[FramePacket]:
+        packet = self.latest()
+        if packet is None or packet.sequence <= sequence:
+            return None
+        return packet
+
+    def wait_after(self, sequence: int, timeout: Optional[float] = None) -> Optional[FramePacket]:
+        with self.new_frame:
+            self.new_frame.wait_for(lambda: self._latest > sequence, timeout)
+        return self.read_after(sequence)
+
+    def is_valid(self, packet: FramePacket) -> bool:
+        with self.lock:
+            return packet.sequence > self._latest + 1 - self.size
+
+    @property
+    def sequence(self) -> int:
+        return self._latest
@@ -0,0 +1,158 @@
+import glob
+import os
+import time
+import cv2
+from typing import List, Optional, Tuple
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.tif', '.tiff')
+
+def _pace(source):
+    now = time.monotonic()
+    if source._started is None:
+        source._started = now
+        return
+    due = source._started + (source.position - source._first_frame) / source.fps
+    if due > now:
+        time.sleep(due - now)
+
+class VideoFileSource:
+    def __init__(self, path: str, start_frame: int = 0, end_frame: Optional[int] = None, realtime: bool = False,
+                 loop: bool = False):
+        self.path = path
+        self.cap = cv2.VideoCapture(path)
+        self.end_frame = end_frame
+        self.realtime = realtime
+        self.loop = loop
+        self.finished = False
+        self.position = start_frame
+        self.fps = self.cap.get(cv2.CAP_PROP_FPS) or 30.0
+        self._started: Optional[float] = None
+
+        if start_frame:
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+        self._first_frame = start_frame
+
+    @property
+    def frame_count(self) -> int:
+        return int(self.cap.get(cv2.CAP_PROP_FRAME_COUNT))
+
+    def isOpened(self) -> bool:
+        return self.cap.isOpened()
+
+    def read(self) -> Tuple[bool, Optional[object]]:
+        ret, frame = self._read()
+        if not ret and self.loop and self.position > self._first_frame:
+            self.rewind()
+            ret, frame = self._read()
+
+        self.finished = not ret
+        return ret, frame
+
+    def _read(self) -> Tuple[bool, Optional[object]]:
+        if self.end_frame is not None and self.position >= self.end_frame:
+            return False, None
+
+        if self.realtime:
+            _pace(self)
+
+        ret, frame = self.cap.read()
+        if ret:
+            self.position += 1
+        return ret, frame
+
+    def rewind(self):
+        self.cap.set(cv2.CAP_PROP_POS_FRAMES, self._first_frame)
+        self.position = self._first_frame
+        self._started = None
+
+    def timestamp_ms(self) -> float:
+        return (self.position - 1) * 1000.0 / self.fps
+
+    def get(self, prop: int) -> float:
+        return self.cap.get(prop)
+
+    def set(self, prop: int, value: float) -> bool:
+        if prop in (cv2.CAP_PROP_FRAME_WIDTH, cv2.CAP_PROP_FRAME_HEIGHT):
+            return False
+        return self.cap.set(prop, value)
+
+    def release(self):
+        self.cap.release()
+
+class ImageSequenceSource:
+    def __init__(self, path: str, start_frame: int = 0, end_frame: Optional[int] = None,
+                 fps: float = 30.0, realtime: bool = False, loop: bool = False):
+        self.path = path
+        self.files = list_images(path)
+        self.end_frame = len(self.files) if end_frame is None else min(end_frame, len(self.files))
+        self.position = start_frame
+        self.fps = fps
+        self.realtime = realtime
+        self.loop = loop
+        self.finished = False
+        self._first_frame = start_frame
+        self._started: Optional[float] = None
+        self._opened = bool(self.files)
+
+    @property
+    def frame_count(self) -> int:
+        return len(self.files)
+
+    def isOpened(self) -> bool:
+        return self._opened
+
+    def read(self) -> Tuple[bool, Optional[object]]:
+        if self._opened and self.position >= self.end_frame and self.loop and self.end_frame > self._first_frame:
+            self.rewind()
+
+        if not self._opened or self.position >= self.end_frame:
+            self.finished = True
+            return False, None
+
+        if self.realtime:
+            _pace(self)
+
+        frame = cv2.imread(self.files[self.position])
+        self.position += 1
+        return frame is not None, frame
+
+    def rewind(self):
+        self.position = self._first_frame
+        self._started = None
+
+    def timestamp_ms(self) -> float:
+        return (self.position - 1) * 1000.0 / self.fps
+
+    def get(self, prop: int) -> float:
+        if prop == cv2.CAP_PROP_FPS:
+            return self.fps
+        if prop == cv2.CAP_PROP_FRAME_COUNT:
+            return float(len(self.files))
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            return float(self.position)
+        return 0.0
+
+    def set(self, prop: int, value: float) -> bool:
+        if prop == cv2.CAP_PROP_POS_FRAMES:
+            self.position = int(value)
+            return True
+        return False
+
+    def release(self):
+        self._opened = False
+
+def list_images(path: str) -> List[str]:
+    if os.path.isdir(path):
+        files = [os.path.join(path, name) for name in os.listdir(path)]
+    else:
+        files = glob.glob(path)
+    return sorted(f for f in files if f.lower().endswith(IMAGE_EXTENSIONS))
+
+def is_image_sequence(path: str) -> bool:
+    return os.path.isdir(path) or any(char in path for char in '*?[')
+
+def open_source(path: str, start_frame: int = 0, end_frame: Optional[int] = None, realtime: bool = False,
+                loop: bool = False):
+    if is_image_sequence(path):
+        return ImageSequenceSource(path, start_frame, end_frame, realtime=realtime, loop=loop)
+    return VideoFileSource(path, start_frame, end_frame, realtime, loop)
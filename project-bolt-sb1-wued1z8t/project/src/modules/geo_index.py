@@ -0,0 +1,112 @@
+import csv
+import math
+import numpy as np
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+EARTH_RADIUS_M = 6371008.8
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS_M / 180.0
+
+def haversine_m(lat1, lon1, lat2, lon2) -> np.ndarray:
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=np.float64)) for v in (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+class GeoIndex:
+    def __init__(self, points: Iterable[Tuple[float, float]], cell_size_m: float = 250.0,
+                 kinds: Optional[Sequence[str]] = None):
+        coords = np.asarray(list(points), dtype=np.float64).reshape(-1, 2)
+        self.cell_deg = cell_size_m / METERS_PER_DEGREE
+        self.cell_size_m = cell_size_m
+
+        keys = self._cell_keys(coords[:, 0], coords[:, 1])
+        order = np.argsort(keys, kind='stable')
+
+        self.keys = keys[order]
+        self.lat = coords[order, 0]
+        self.lon = coords[order, 1]
+        self.original_index = order
+        self.positions = np.empty_like(order)
+        self.positions[order] = np.arange(len(order))
+        self.kinds = np.asarray(kinds, dtype=object)[order] if kinds is not None else None
+
+    @classmethod
+    def from_csv(cls, path: str, cell_size_m: float = 250.0, kind: Optional[str] = None) -> 'GeoIndex':
+        points = []
+        kinds = []
+        with open(path, newline='') as handle:
+            for row in csv.DictReader(handle):
+                row_kind = row.get('kind') or 'intersection'
+                if kind is not None and row_kind != kind:
+                    continue
+                points.append((float(row['lat']), float(row['lon'])))
+                kinds.append(row_kind)
+        return cls(points, cell_size_m, kinds)
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    def _cell_keys(self, lat, lon) -> np.ndarray:
+        row = np.floor((np.asarray(lat) + 90.0) / self.cell_deg).astype(np.int64)
+        col = np.floor((np.asarray(lon) + 180.0) / self.cell_deg).astype(np.int64)
+        return row * 10000000 + col
+
+    def _candidates(self, lats: np.ndarray, lons: np.ndarray, radius_m: float) -> Tuple[np.ndarray, np.ndarray]:
+        lat_span = int(math.ceil(radius_m / self.cell_size_m))
+        max_lat = min(float(np.max(np.abs(lats))) + lat_span * self.cell_deg, 89.0)
+        lon_span = int(math.ceil(radius_m / (self.cell_size_m * math.cos(math.radians(max_lat)))))
+
+        offsets = np.arange(-lat_span, lat_span + 1)[:, None] * 10000000 + np.arange(-lon_span, lon_span + 1)[None, :]
+        cells = (self._cell_keys(lats, lons)[:, None] + offsets.ravel()[None, :]).ravel()
+
+        starts = np.searchsorted(self.keys, cells, 'left')
+        ends = np.searchsorted(self.keys, cells, 'right')
+        lengths = ends - starts
+        total = int(lengths.sum())
+        if total == 0:
+            return np.zeros(0, dtype=np.intp), np.zeros(0, dtype=np.intp)
+
+        query = np.repeat(np.arange(len(cells)) // offsets.size, lengths)
+        run_starts = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+        point = run_starts + np.arange(total)
+        return query, point
+
+    def query_radius(self, lat: float, lon: float, radius_m: float) -> Tuple[np.ndarray, np.ndarray]:
+        query, point = self._candidates(np.array([lat]), np.array([lon]), radius_m)
+        distances = haversine_m(lat, lon, self.lat[point], self.lon[point])
+        inside = distances <= radius_m
+        order = np.argsort(distances[inside])
+        return self.original_index[point[inside][order]], distances[inside][order]
+
+    def nearest(self, lat: float, lon: float, k: int = 1,
+                max_radius_m: float = 50000.0) -> Tuple[np.ndarray, np.ndarray]:
+        radius = self.cell_size_m
+        while True:
+            indices, distances = self.query_radius(lat, lon, radius)
+            if len(indices) >= k or radius >= max_radius_m:
+                return indices[:k], distances[:k]
+            radius = min(radius * 2, max_radius_m)
+
+    def any_within(self, lat: float, lon: float, radius_m: float) -> bool:
+        return len(self.query_radius(lat, lon, radius_m)[0]) > 0
+
+    def score_trajectory(self, lats: Sequence[float], lons: Sequence[float],
+                         radius_m: float) -> Tuple[np.ndarray, np.ndarray]:
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        counts = np.zeros(len(lats), dtype=np.int64)
+        nearest = np.full(len(lats), np.inf)
+        if len(lats) == 0 or len(self) == 0:
+            return counts, nearest
+
+        query, point = self._candidates(lats, lons, radius_m)
+        distances = haversine_m(lats[query], lons[query], self.lat[point], self.lon[point])
+        inside = distances <= radius_m
+
+        np.add.at(counts, query[inside], 1)
+        np.minimum.at(nearest, query[inside], distances[inside])
+        return counts, nearest
+
+    def kinds_of(self, indices: np.ndarray) -> List[str]:
+        if self.kinds is None:
+            return []
+        return list(self.kinds[self.positions[indices]])
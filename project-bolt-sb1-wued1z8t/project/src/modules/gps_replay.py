@@ -0,0 +1,273 @@
+import csv
+import os
+import time
+import xml.etree.ElementTree as ET
+import numpy as np
+from datetime import datetime, timezone
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from modules.geo_index import haversine_m
+from modules.gps_simulator import GPSSimulator
+from modules.metrics import metrics
+
+KNOTS_TO_KMH = 1.852
+
+def _parse_time(value: str) -> float:
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    parsed = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+def _nmea_coordinate(value: str, hemisphere: str, degree_digits: int) -> float:
+    degrees = float(value[:degree_digits]) + float(value[degree_digits:]) / 60.0
+    return -degrees if hemisphere in ('S', 'W') else degrees
+
+def _nmea_seconds(value: str) -> float:
+    return int(value[0:2]) * 3600 + int(value[2:4]) * 60 + float(value[4:])
+
+class TracePoint(NamedTuple):
+    timestamp: float
+    lat: float
+    lon: float
+    speed: Optional[float]
+    course: Optional[float]
+
+def _optional_float(value: Optional[str]) -> Optional[float]:
+    return float(value) if value not in (None, '') else None
+
+def load_csv_trace(path: str) -> List[TracePoint]:
+    points = []
+    with open(path, newline='') as handle:
+        for row in csv.DictReader(handle):
+            timestamp = row.get('timestamp') or row.get('time')
+            points.append(TracePoint(
+                _parse_time(timestamp),
+                float(row['lat']),
+                float(row['lon']),
+                _optional_float(row.get('speed')),
+                _optional_float(row.get('course') or row.get('heading'))
+            ))
+    return points
+
+def _nmea_epochs(path: str) -> List[Dict]:
+    epochs = []
+    with open(path) as handle:
+        for line in handle:
+            fields = line.strip().split('*')[0].split(',')
+            kind = fields[0][-3:]
+
+            try:
+                if kind == 'RMC' and len(fields) > 9 and fields[2] == 'A':
+                    fix = {
+                        'of_day': _nmea_seconds(fields[1]),
+                        'lat': _nmea_coordinate(fields[3], fields[4], 2),
+                        'lon': _nmea_coordinate(fields[5], fields[6], 3),
+                        'speed': float(fields[7]) * KNOTS_TO_KMH if fields[7] else None,
+                        'course': _optional_float(fields[8]),
+                        'day_start': datetime.strptime(fields[9], '%d%m%y').replace(
+                            tzinfo=timezone.utc).timestamp() if fields[9] else None
+                    }
+                elif kind == 'GGA' and len(fields) > 6 and fields[6] not in ('', '0'):
+                    fix = {
+                        'of_day': _nmea_seconds(fields[1]),
+                        'lat': _nmea_coordinate(fields[2], fields[3], 2),
+                        'lon': _nmea_coordinate(fields[4], fields[5], 3)
+                    }
+                else:
+                    continue
+            except (ValueError, IndexError):
+                continue
+
+            if epochs and epochs[-1]['of_day'] == fix['of_day']:
+                epoch = epochs[-1]
+                for key in ('speed', 'course', 'day_start'):
+                    if fix.get(key) is not None:
+                        epoch[key] = fix[key]
+            else:
+                epochs.append({'speed': None, 'course': None, 'day_start': None, **fix})
+    return epochs
+
+def load_nmea_trace(path: str) -> List[TracePoint]:
+    epochs = _nmea_epochs(path)
+    if not epochs:
+        return []
+
+    dated = [index for index, epoch in enumerate(epochs) if epoch['day_start'] is not None]
+    anchor = dated[0] if dated else 0
+    day_starts = [0.0] * len(epochs)
+
+    day_start = epochs[anchor]['day_start'] or 0.0
+    last_of_day = None
+    for index in range(anchor, len(epochs)):
+        epoch = epochs[index]
+        if epoch['day_start'] is not None:
+            day_start = epoch['day_start']
+        elif last_of_day is not None and epoch['of_day'] < last_of_day - 43200:
+            day_start += 86400
+        last_of_day = epoch['of_day']
+        day_starts[index] = day_start
+
+    day_start = day_starts[anchor]
+    next_of_day = epochs[anchor]['of_day']
+    for index in range(anchor - 1, -1, -1):
+        epoch = epochs[index]
+        if epoch['of_day'] > next_of_day + 43200:
+            day_start -= 86400
+        next_of_day = epoch['of_day']
+        day_starts[index] = day_start
+
+    points = []
+    for epoch, day_start in zip(epochs, day_starts):
+        seconds = day_start + epoch['of_day']
+        if points and seconds <= points[-1].timestamp:
+            continue
+        points.append(TracePoint(seconds, epoch['lat'], epoch['lon'], epoch['speed'], epoch['course']))
+
+    return points
+
+def load_gpx_trace(path: str) -> List[TracePoint]:
+    points = []
+    for element in ET.parse(path).getroot().iter():
+        if not element.tag.endswith('trkpt'):
+            continue
+
+        timestamp = None
+        for child in element:
+            if child.tag.endswith('time') and child.text:
+                timestamp = _parse_time(child.text)
+        if timestamp is None:
+            timestamp = float(len(points))
+
+        points.append(TracePoint(timestamp, float(element.get('lat')), float(element.get('lon')), None, None))
+    return points
+
+def load_trace(path: str) -> List[TracePoint]:
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.gpx':
+        return load_gpx_trace(path)
+    if extension in ('.nmea', '.txt', '.log'):
+        return load_nmea_trace(path)
+    return load_csv_trace(path)
+
+class GPSReplaySource(GPSSimulator):
+    def __init__(self, path: str, playback_speed: float = 1.0, rate_hz: float = 10.0, loop: bool = False):
+        super().__init__()
+
+        points = sorted(load_trace(path), key=lambda point: point.timestamp)
+        if len(points) < 2:
+            raise ValueError(f"GPS trace {path} needs at least two points")
+
+        self.times = np.array([p.timestamp for p in points], dtype=np.float64)
+        self.lats = np.array([p.lat for p in points], dtype=np.float64)
+        self.lons = np.array([p.lon for p in points], dtype=np.float64)
+        self.speeds = self._speeds([p.speed for p in points])
+        self.courses = np.array([np.nan if p.course is None else p.course for p in points], dtype=np.float64)
+
+        self.playback_speed = playback_speed
+        self.rate_hz = rate_hz
+        self.loop = loop
+        self.updates = 0
+        self.late_ticks = 0
+        self.finished = False
+
+        self.latitude = float(self.lats[0])
+        self.longitude = float(self.lons[0])
+        self.speed = float(self.speeds[0])
+        self.course = self.course_at(float(self.times[0]))
+
+    def _speeds(self, recorded: List[Optional[float]]) -> np.ndarray:
+        distances = haversine_m(self.lats[:-1], self.lons[:-1], self.lats[1:], self.lons[1:])
+        intervals = np.maximum(np.diff(self.times), 1e-6)
+        derived = np.concatenate(([0.0], distances / intervals * 3.6))
+        if len(derived) > 1:
+            derived[0] = derived[1]
+
+        return np.array([
+            speed if speed is not None else derived[index]
+            for index, speed in enumerate(recorded)
+        ], dtype=np.float64)
+
+    @property
+    def duration(self) -> float:
+        return float(self.times[-1] - self.times[0])
+
+    def sample(self, trace_time: float) -> Tuple[float, float, float]:
+        return (
+            float(np.interp(trace_time, self.times, self.lats)),
+            float(np.interp(trace_time, self.times, self.lons)),
+            float(np.interp(trace_time, self.times, self.speeds))
+        )
+
+    def course_at(self, trace_time: float) -> Optional[float]:
+        index = int(np.searchsorted(self.times, trace_time, side='right')) - 1
+        course = self.courses[max(index, 0)]
+        return None if np.isnan(course) else float(course)
+
+    def _publish(self, trace_time: float):
+        self.latitude, self.longitude, self.speed = self.sample(trace_time)
+        self.course = self.course_at(trace_time)
+        self.updates += 1
+        metrics.tick('gps_update')
+
+        if self.update_callback:
+            self.update_callback(self.latitude, self.longitude, self.speed)
+
+    def _update_loop(self):
+        step = 1.0 / self.rate_hz
+
+        while self.is_running:
+            if self.playback_speed <= 0:
+                for trace_time in np.arange(self.times[0], self.times[-1] + step / 2, step):
+                    if not self.is_running:
+                        return
+                    self._publish(float(trace_time))
+            else:
+                self._paced_pass(step)
+
+            if not self.loop:
+                break
+
+        self.finished = True
+        self.is_running = False
+
+    def _paced_pass(self, step: float):
+        started = time.monotonic()
+        tick = 0
+
+        while self.is_running:
+            trace_time = self.times[0] + tick * step * self.playback_speed
+            if trace_time > self.times[-1]:
+                self._publish(float(self.times[-1]))
+                return
+
+            self._publish(float(trace_time))
+
+            tick += 1
+            delay = started + tick * step - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                skipped = int(-delay / step)
+                self.late_ticks += 1 + skipped
+                tick += skipped
+
+def create_gps_source() -> GPSSimulator:
+    path = os.getenv('GPS_REPLAY_FILE', '')
+    if not path:
+        return GPSSimulator()
+
+    try:
+        return GPSReplaySource(
+            path,
+            playback_speed=float(os.getenv('GPS_REPLAY_SPEED', '1.0')),
+            rate_hz=float(os.getenv('GPS_REPLAY_RATE_HZ', '10')),
+            loop=os.getenv('GPS_REPLAY_LOOP', '').lower() in ('1', 'true', 'yes')
+        )
+    except Exception as e:
+        print(f"Failed to load GPS trace {path}: {e}")
+        return GPSSimulator()
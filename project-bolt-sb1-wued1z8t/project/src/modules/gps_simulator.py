@@ -1,7 +1,10 @@
+import os
 import random
 import time
 import threading
 from typing import Callable, Optional, Tuple
+from modules.geo_index import GeoIndex
+from modules.metrics import metrics
 
 class GPSSimulator:
     def __init__(self):
@@ -17,6 +20,25 @@ class GPSSimulator:
             (12.9740, 77.5970),
             (12.9750, 77.5980),
         ]
+        self.intersection_index = GeoIndex(self.intersections)
+        self.hazard_index: Optional[GeoIndex] = None
+
+        map_file = os.getenv('GPS_MAP_POINTS_FILE', '')
+        if map_file:
+            self.load_map_points(map_file)
+
+    def load_map_points(self, path: str):
+        try:
+            intersections = GeoIndex.from_csv(path, kind='intersection')
+            hazards = GeoIndex.from_csv(path, kind='hazard')
+        except Exception as e:
+            print(f"Failed to load map points from {path}: {e}")
+            return
+
+        if len(intersections):
+            self.intersection_index = intersections
+        self.hazard_index = hazards if len(hazards) else None
+        print(f"Loaded {len(intersections)} intersections and {len(hazards)} hazard points")
 
     def start(self):
         self.is_running = True
@@ -27,6 +49,7 @@ class GPSSimulator:
             self.latitude += random.uniform(-0.0001, 0.0002)
             self.longitude += random.uniform(-0.0001, 0.0002)
             self.speed = random.uniform(20, 80)
+            metrics.tick('gps_update')
 
             if self.update_callback:
                 self.update_callback(self.latitude, self.longitude, self.speed)
@@ -39,15 +62,15 @@ class GPSSimulator:
     def get_speed(self) -> float:
         return self.speed
 
-    def is_near_intersection(self, threshold: float = 0.001) -> bool:
+    def is_near_intersection(self, radius_m: float = 110.0) -> bool:
         current_lat, current_lon = self.get_coordinates()
+        return self.intersection_index.any_within(current_lat, current_lon, radius_m)
 
-        for int_lat, int_lon in self.intersections:
-            distance = ((current_lat - int_lat) ** 2 + (current_lon - int_lon) ** 2) ** 0.5
-            if distance < threshold:
-                return True
-
-        return False
+    def nearby_hazards(self, radius_m: float = 200.0):
+        if self.hazard_index is None:
+            return [], []
+        current_lat, current_lon = self.get_coordinates()
+        return self.hazard_index.query_radius(current_lat, current_lon, radius_m)
 
     def set_update_callback(self, callback: Callable):
         self.update_callback = callback
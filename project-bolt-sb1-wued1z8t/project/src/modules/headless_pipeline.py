@@ -0,0 +1,172 @@
+import json
+import os
+import cv2
+import multiprocessing as mp
+from typing import Dict, Iterable, List, Optional, Tuple
+from modules.ai_detector import AIDetector
+from modules.blind_spot_monitor import BlindSpotMonitor
+from modules.frame_context import FrameContext
+from modules.frame_source import open_source
+from modules.lane_estimator import LaneEstimator
+from modules.vehicle_tracker import VehicleTracker
+
+VEHICLE_FIELDS = ('x', 'y', 'w', 'h', 'confidence', 'track_id', 'approach_rate')
+
+class HeadlessPipeline:
+    def __init__(self, view: str = "rear", mirror: bool = False):
+        self.view = view
+        self.mirror = mirror
+        self.detector = AIDetector()
+        self.lane_estimator = LaneEstimator()
+        self.vehicle_tracker = VehicleTracker()
+        self.blind_spot_monitor = BlindSpotMonitor()
+
+    def process(self, frame, sequence: int, timestamp_ms: float) -> Dict:
+        if self.mirror:
+            frame = cv2.flip(frame, 1)
+
+        context = FrameContext.of(frame, sequence)
+        lines = self.lane_estimator.update(context, self.detector)
+        vehicles = self.vehicle_tracker.detect(context, self.detector, timestamp_ms / 1000.0)
+        blind_spots = self.blind_spot_monitor.update(context, self.detector)
+
+        record = {
+            'frame': sequence,
+            'timestamp_ms': round(timestamp_ms, 1),
+            'view': self.view,
+            'lanes': [[int(v) for v in line[0]] for line in lines],
+            'lane_deviation': round(self.lane_estimator.deviation, 4),
+            'vehicles': [{field: vehicle[field] for field in VEHICLE_FIELDS} for vehicle in vehicles],
+        }
+        for side in BlindSpotMonitor.SIDES:
+            record[f'blind_spot_{side}'] = bool(blind_spots[side]['warning'])
+            record[f'blind_spot_{side}_objects'] = int(blind_spots[side]['object_count'])
+        return record
+
+def split_segments(path: str, segment_frames: int) -> List[Tuple[int, int]]:
+    source = open_source(path)
+    total = source.frame_count
+    source.release()
+
+    if total <= 0:
+        return [(0, None)]
+    return [(start, min(start + segment_frames, total)) for start in range(0, total, segment_frames)]
+
+def write_records(records: List[Dict], path: str, output_format: str):
+    if output_format == 'parquet':
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        pq.write_table(pa.Table.from_pylist(records, schema=parquet_schema()), path)
+        return
+
+    with open(path, 'w') as handle:
+        for record in records:
+            handle.write(json.dumps(record) + "\n")
+
+def parquet_schema():
+    import pyarrow as pa
+    vehicle = pa.struct([
+        ('x', pa.int32()), ('y', pa.int32()), ('w', pa.int32()), ('h', pa.int32()),
+        ('confidence', pa.float32()), ('track_id', pa.int32()), ('approach_rate', pa.float32())
+    ])
+    return pa.schema([
+        ('source', pa.string()),
+        ('frame', pa.int64()),
+        ('timestamp_ms', pa.float64()),
+        ('view', pa.string()),
+        ('lanes', pa.list_(pa.list_(pa.int32()))),
+        ('lane_deviation', pa.float32()),
+        ('vehicles', pa.list_(vehicle)),
+        ('blind_spot_left', pa.bool_()),
+        ('blind_spot_left_objects', pa.int32()),
+        ('blind_spot_right', pa.bool_()),
+        ('blind_spot_right_objects', pa.int32()),
+    ])
+
+def analyze_segment(task: Dict) -> Tuple[int, str, int]:
+    source = open_source(task['path'], task['start'], task['end'])
+    pipeline = HeadlessPipeline(task['view'], task['mirror'])
+    records = []
+    frames = 0
+
+    try:
+        while True:
+            ret, frame = source.read()
+            if not ret:
+                break
+
+            index = source.position - 1
+            if (index - task['start']) % task['stride'] == 0:
+                record = pipeline.process(frame, index, source.timestamp_ms())
+                record['source'] = task['path']
+                records.append(record)
+            frames += 1
+    finally:
+        source.release()
+
+    write_records(records, task['part_path'], task['format'])
+    return task['index'], task['part_path'], frames
+
+class PartMerger:
+    def __init__(self, output: str, output_format: str):
+        self.output_format = output_format
+        self.next_index = 0
+        self.pending: Dict[int, str] = {}
+
+        if output_format == 'parquet':
+            import pyarrow.parquet as pq
+            self.writer = pq.ParquetWriter(output, parquet_schema())
+        else:
+            self.writer = open(output, 'w')
+
+    def add(self, index: int, part: str):
+        self.pending[index] = part
+        while self.next_index in self.pending:
+            self._append(self.pending.pop(self.next_index))
+            self.next_index += 1
+
+    def _append(self, part: str):
+        if self.output_format == 'parquet':
+            import pyarrow.parquet as pq
+            self.writer.write_table(pq.read_table(part, schema=parquet_schema()))
+        else:
+            with open(part) as part_handle:
+                for line in part_handle:
+                    self.writer.write(line)
+            self.writer.flush()
+        os.remove(part)
+
+    def close(self):
+        self.writer.close()
+
+def run_batch(inputs: Iterable[str], output: str, output_format: str = 'jsonl', workers: Optional[int] = None,
+              segment_frames: int = 1800, view: str = "rear", mirror: bool = False, stride: int = 1) -> int:
+    tasks = []
+    for path in inputs:
+        for start, end in split_segments(path, segment_frames):
+            index = len(tasks)
+            tasks.append({
+                'index': index, 'path': path, 'start': start, 'end': end,
+                'view': view, 'mirror': mirror, 'stride': stride, 'format': output_format,
+                'part_path': f"{output}.part{index:05d}"
+            })
+
+    workers = workers or os.cpu_count() or 1
+    merger = PartMerger(output, output_format)
+
+    try:
+        if workers == 1 or len(tasks) == 1:
+            return _collect(map(analyze_segment, tasks), merger, len(tasks))
+
+        with mp.get_context('spawn').Pool(min(workers, len(tasks))) as pool:
+            return _collect(pool.imap_unordered(analyze_segment, tasks), merger, len(tasks))
+    finally:
+        merger.close()
+
+def _collect(results: Iterable[Tuple[int, str, int]], merger: PartMerger, total: int) -> int:
+    total_frames = 0
+    for index, part, frames in results:
+        total_frames += frames
+        merger.add(index, part)
+        print(f"Segment {index + 1}/{total} done ({frames} frames), {merger.next_index}/{total} written")
+    return total_frames
@@ -0,0 +1,170 @@
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+class LaneFit:
+    def __init__(self, slope: float, intercept: float):
+        self.slope = slope
+        self.intercept = intercept
+        self.misses = 0
+        self.hits = 1
+
+    def x_at(self, y: float) -> float:
+        return self.slope * y + self.intercept
+
+    def blend(self, slope: float, intercept: float, smoothing: float):
+        self.slope += smoothing * (slope - self.slope)
+        self.intercept += smoothing * (intercept - self.intercept)
+        self.misses = 0
+        self.hits += 1
+
+class LaneEstimator:
+    def __init__(self, smoothing: float = 0.3, band_width: int = 40, max_misses: int = 5,
+                 min_slope: float = 0.3, deviation_threshold: float = 0.25, deviation_frames: int = 8):
+        self.smoothing = smoothing
+        self.band_width = band_width
+        self.max_misses = max_misses
+        self.min_slope = min_slope
+        self.deviation_threshold = deviation_threshold
+        self.deviation_frames = deviation_frames
+
+        self.left: Optional[LaneFit] = None
+        self.right: Optional[LaneFit] = None
+        self.deviation = 0.0
+        self.deviating_frames = 0
+        self.full_scans = 0
+        self.band_scans = 0
+
+    @property
+    def locked(self) -> bool:
+        return self.left is not None and self.right is not None
+
+    def update(self, context, detector) -> List[np.ndarray]:
+        height, width = context.shape[:2]
+        polygons = self.search_polygons(height, width)
+
+        if polygons is not None:
+            segments = detector.detect_lane_lines(context, detector.band_mask(polygons, context.shape))
+        else:
+            segments = detector.detect_lane_lines(context)
+
+        return self.update_segments(segments, context.shape, banded=polygons is not None)
+
+    def update_segments(self, segments, shape, banded: bool = False) -> List[np.ndarray]:
+        if banded:
+            self.band_scans += 1
+        else:
+            self.full_scans += 1
+
+        height, width = shape[:2]
+        left, right = self._fit_sides(segments, width)
+        self.left = self._track(self.left, left)
+        self.right = self._track(self.right, right)
+        self._update_deviation(height, width)
+
+        return self.lane_lines(height)
+
+    def search_polygons(self, height: int, width: int) -> Optional[List[np.ndarray]]:
+        if not self.locked:
+            return None
+
+        top = height // 2
+        polygons = []
+        for fit in (self.left, self.right):
+            x_bottom, x_top = fit.x_at(height), fit.x_at(top)
+            polygons.append(np.array([[
+                (int(x_bottom - self.band_width), height),
+                (int(x_top - self.band_width), top),
+                (int(x_top + self.band_width), top),
+                (int(x_bottom + self.band_width), height)
+            ]], np.int32))
+        return polygons
+
+    def _fit_sides(self, segments, width: int) -> Tuple[Optional[Tuple[float, float]], Optional[Tuple[float, float]]]:
+        if len(segments) == 0:
+            return None, None
+
+        points = np.asarray(segments, dtype=np.float32).reshape(-1, 4)
+        x1, y1, x2, y2 = points.T
+        dy = y2 - y1
+        dx = x2 - x1
+        with np.errstate(divide='ignore', invalid='ignore'):
+            image_slope = np.where(dx != 0, dy / dx, np.inf)
+
+        steep = np.abs(image_slope) > self.min_slope
+        center = width / 2
+        left = steep & (image_slope < 0) & (np.maximum(x1, x2) < center + width * 0.1)
+        right = steep & (image_slope > 0) & (np.minimum(x1, x2) > center - width * 0.1)
+
+        return self._fit(points[left]), self._fit(points[right])
+
+    def _fit(self, points: np.ndarray) -> Optional[Tuple[float, float]]:
+        if len(points) == 0:
+            return None
+
+        ys = np.concatenate((points[:, 1], points[:, 3]))
+        xs = np.concatenate((points[:, 0], points[:, 2]))
+        lengths = np.hypot(points[:, 2] - points[:, 0], points[:, 3] - points[:, 1])
+        weights = np.concatenate((lengths, lengths))
+
+        if np.ptp(ys) < 1:
+            return None
+
+        slope, intercept = np.polyfit(ys, xs, 1, w=weights)
+        return float(slope), float(intercept)
+
+    def _track(self, current: Optional[LaneFit], measured: Optional[Tuple[float, float]]) -> Optional[LaneFit]:
+        if measured is None:
+            if current is None:
+                return None
+            current.misses += 1
+            return current if current.misses <= self.max_misses else None
+
+        if current is None:
+            return LaneFit(*measured)
+
+        current.blend(measured[0], measured[1], self.smoothing)
+        return current
+
+    def _update_deviation(self, height: int, width: int):
+        if not self.locked:
+            self.deviation = 0.0
+            self.deviating_frames = 0
+            return
+
+        left_x = self.left.x_at(height)
+        right_x = self.right.x_at(height)
+        lane_width = right_x - left_x
+        if lane_width <= 0:
+            self.deviation = 0.0
+            return
+
+        self.deviation = ((left_x + right_x) / 2 - width / 2) / lane_width
+        if abs(self.deviation) > self.deviation_threshold:
+            self.deviating_frames += 1
+        else:
+            self.deviating_frames = 0
+
+    def is_deviating(self) -> bool:
+        return self.deviating_frames >= self.deviation_frames
+
+    def lane_lines(self, height: int) -> List[np.ndarray]:
+        top = height // 2
+        lines = []
+        for fit in (self.left, self.right):
+            if fit is not None:
+                lines.append(np.array([[int(fit.x_at(height)), height, int(fit.x_at(top)), top]], dtype=np.int32))
+        return lines
+
+    def stats(self) -> Dict:
+        return {
+            'locked': self.locked,
+            'deviation': self.deviation,
+            'full_scans': self.full_scans,
+            'band_scans': self.band_scans
+        }
+
+    def reset(self):
+        self.left = None
+        self.right = None
+        self.deviation = 0.0
+        self.deviating_frames = 0
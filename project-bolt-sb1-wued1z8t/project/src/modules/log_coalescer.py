@@ -0,0 +1,99 @@
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+class CoalescingWindow:
+    def __init__(self, active: bool, now: float):
+        self.active = active
+        self.started = now
+        self.last_seen = now
+        self.count = 0
+        self.minimum: Optional[int] = None
+        self.maximum: Optional[int] = None
+        self.total = 0
+        self.first_timestamp: Optional[str] = None
+        self.last_timestamp: Optional[str] = None
+
+    def add(self, value: Optional[int], timestamp: str, now: float):
+        self.count += 1
+        self.last_seen = now
+        if self.first_timestamp is None:
+            self.first_timestamp = timestamp
+        self.last_timestamp = timestamp
+
+        if value is not None:
+            self.minimum = value if self.minimum is None else min(self.minimum, value)
+            self.maximum = value if self.maximum is None else max(self.maximum, value)
+            self.total += value
+
+    def summary(self, label: str) -> str:
+        details = f'{label} summary: {self.count} repeats in {self.last_seen - self.started:.1f}s'
+        if self.minimum is not None:
+            details += f', objects min {self.minimum} / max {self.maximum} / mean {self.total / self.count:.1f}'
+        return f'{details}, first {self.first_timestamp}, last {self.last_timestamp}'
+
+class EventCoalescer:
+    def __init__(self, emit: Callable[[str, str, Optional[str]], None], window: float = 5.0):
+        self.emit = emit
+        self.window = window
+        self.windows: Dict[Tuple[str, str, Optional[str]], CoalescingWindow] = {}
+        self.received = 0
+        self.emitted = 0
+        self.lock = threading.Lock()
+        self.is_running = True
+
+        threading.Thread(target=self._expiry_loop, daemon=True).start()
+
+    def record(self, event_type: str, label: str, details: str, view: Optional[str] = None,
+               value: Optional[int] = None):
+        now = time.monotonic()
+        timestamp = datetime.now().isoformat()
+        key = (event_type, label, view)
+        active = value is None or value > 0
+        pending: List[Tuple[str, str, Optional[str]]] = []
+
+        with self.lock:
+            self.received += 1
+            current = self.windows.get(key)
+
+            if current is None or current.active != active:
+                if current is not None and current.count:
+                    pending.append((event_type, current.summary(label), view))
+                self.windows[key] = CoalescingWindow(active, now)
+                pending.append((event_type, details, view))
+            else:
+                current.add(value, timestamp, now)
+                if now - current.started >= self.window:
+                    pending.append((event_type, current.summary(label), view))
+                    self.windows[key] = CoalescingWindow(active, now)
+
+        self._emit_all(pending)
+
+    def close_expired(self, force: bool = False):
+        now = time.monotonic()
+        pending = []
+
+        with self.lock:
+            for key, current in list(self.windows.items()):
+                if force or now - current.last_seen >= self.window:
+                    event_type, label, view = key
+                    if current.count:
+                        pending.append((event_type, current.summary(label), view))
+                    del self.windows[key]
+
+        self._emit_all(pending)
+
+    def _emit_all(self, pending: List[Tuple[str, str, Optional[str]]]):
+        for event_type, details, view in pending:
+            self.emitted += 1
+            self.emit(event_type, details, view)
+
+    def _expiry_loop(self):
+        while self.is_running:
+            time.sleep(min(self.window, 1.0))
+            self.close_expired()
+
+    def stop(self):
+        self.is_running = False
+        self.close_expired(force=True)
@@ -0,0 +1,219 @@
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+class LocalLogStore:
+    COLUMNS = ('id', 'timestamp', 'event_type', 'details', 'camera_view', 'created_at')
+
+    def __init__(self, path: str, max_rows: int = 100000, max_bytes: int = 50 * 1024 * 1024,
+                 prune_every: int = 500):
+        self.path = path
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.prune_every = prune_every
+        self.dropped = 0
+        self.lock = threading.Lock()
+        self._appends_since_prune = 0
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._initialize_schema()
+
+    def _initialize_schema(self):
+        with self.lock:
+            self.conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS system_logs (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    id TEXT NOT NULL UNIQUE,
+                    timestamp TEXT NOT NULL,
+                    event_type TEXT NOT NULL,
+                    details TEXT NOT NULL,
+                    camera_view TEXT,
+                    created_at TEXT NOT NULL
+                )
+            """)
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS replay_state (
+                    key TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                )
+            """)
+            self.conn.execute("INSERT OR IGNORE INTO replay_state (key, value) VALUES ('high_water', 0)")
+            self.conn.commit()
+
+    def append(self, entry: Dict) -> int:
+        row = (
+            entry.get('id') or str(uuid.uuid4()),
+            entry['timestamp'],
+            entry['event_type'],
+            entry['details'],
+            entry.get('camera_view'),
+            entry.get('created_at') or datetime.now().isoformat()
+        )
+
+        with self.lock:
+            cursor = self.conn.execute(
+                "INSERT INTO system_logs (id, timestamp, event_type, details, camera_view, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                row
+            )
+            self.conn.commit()
+            self._appends_since_prune += 1
+            return cursor.lastrowid
+
+    def prune_due(self) -> bool:
+        return self._appends_since_prune >= self.prune_every
+
+    def high_water(self) -> int:
+        with self.lock:
+            return self._high_water()
+
+    def _high_water(self) -> int:
+        return self.conn.execute("SELECT value FROM replay_state WHERE key = 'high_water'").fetchone()[0]
+
+    def read_unsent(self, limit: int) -> Tuple[int, List[Dict]]:
+        with self.lock:
+            rows = self.conn.execute(
+                "SELECT seq, id, timestamp, event_type, details, camera_view, created_at "
+                "FROM system_logs WHERE seq > ? ORDER BY seq LIMIT ?",
+                (self._high_water(), limit)
+            ).fetchall()
+
+        if not rows:
+            return 0, []
+        return rows[-1][0], [dict(zip(self.COLUMNS, row[1:])) for row in rows]
+
+    def unsent_count(self) -> int:
+        with self.lock:
+            return self.conn.execute(
+                "SELECT COUNT(*) FROM system_logs WHERE seq > ?", (self._high_water(),)
+            ).fetchone()[0]
+
+    def mark_sent(self, seq: int):
+        with self.lock:
+            self.conn.execute(
+                "UPDATE replay_state SET value = MAX(value, ?) WHERE key = 'high_water'", (seq,)
+            )
+            self.conn.commit()
+
+    def prune(self):
+        with self.lock:
+            self._appends_since_prune = 0
+            self.conn.execute("DELETE FROM system_logs WHERE seq <= ?", (self._high_water(),))
+
+            excess = self.conn.execute("SELECT COUNT(*) FROM system_logs").fetchone()[0] - self.max_rows
+            if excess <= 0 and self._size_bytes() > self.max_bytes:
+                excess = max(1, self.max_rows // 10)
+
+            if excess > 0:
+                cursor = self.conn.execute(
+                    "DELETE FROM system_logs WHERE seq IN "
+                    "(SELECT seq FROM system_logs ORDER BY seq LIMIT ?)",
+                    (excess,)
+                )
+                self.dropped += cursor.rowcount
+                print(f"Local log store over quota, dropped {cursor.rowcount} oldest unsent entries")
+
+            self.conn.commit()
+            self.conn.execute("PRAGMA incremental_vacuum")
+            self.conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def _size_bytes(self) -> int:
+        page_count = self.conn.execute("PRAGMA page_count").fetchone()[0]
+        page_size = self.conn.execute("PRAGMA page_size").fetchone()[0]
+        wal_path = self.path + '-wal'
+        wal_size = os.path.getsize(wal_path) if os.path.exists(wal_path) else 0
+        return page_count * page_size + wal_size
+
+    def close(self):
+        with self.lock:
+            self.conn.commit()
+            self.conn.close()
+
+class LogReplayer:
+    def __init__(self, store: LocalLogStore, client, table: str = 'system_logs', max_batch: int = 200,
+                 poll_interval: float = 1.0, backoff_base: float = 1.0, backoff_max: float = 60.0):
+        self.store = store
+        self.client = client
+        self.table = table
+        self.max_batch = max_batch
+        self.poll_interval = poll_interval
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+        self.uploaded = 0
+        self.consecutive_failures = 0
+        self.condition = threading.Condition()
+        self.is_running = True
+        self._wake = False
+
+        self.thread = threading.Thread(target=self._replay_loop, daemon=True)
+        self.thread.start()
+
+    def notify(self):
+        with self.condition:
+            self._wake = True
+            self.condition.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        if self.client is None:
+            return True
+
+        self.notify()
+        with self.condition:
+            return self.condition.wait_for(
+                lambda: self.store.unsent_count() == 0 or self.consecutive_failures > 0, timeout
+            ) and self.consecutive_failures == 0
+
+    def stop(self, timeout: float = 5.0) -> bool:
+        self.flush(timeout)
+        with self.condition:
+            self.is_running = False
+            self.condition.notify_all()
+
+        self.thread.join(timeout)
+        return not self.thread.is_alive()
+
+    def _replay_loop(self):
+        while self.is_running:
+            if self.store.prune_due():
+                try:
+                    self.store.prune()
+                except Exception as e:
+                    print(f"Failed to prune local log store: {e}")
+
+            last_seq, rows = self.store.read_unsent(self.max_batch) if self.client is not None else (0, [])
+
+            if rows:
+                try:
+                    self._upload(rows)
+                    self.store.mark_sent(last_seq)
+                    self.uploaded += len(rows)
+                    self.consecutive_failures = 0
+                    with self.condition:
+                        self.condition.notify_all()
+                    continue
+                except Exception as e:
+                    self.consecutive_failures += 1
+                    print(f"Failed to replay logs to Supabase ({len(rows)} pending): {e}")
+
+            with self.condition:
+                self.condition.notify_all()
+                if self.consecutive_failures:
+                    delay = min(self.backoff_base * (2 ** (self.consecutive_failures - 1)), self.backoff_max)
+                    self.condition.wait_for(lambda: not self.is_running, delay)
+                else:
+                    self.condition.wait_for(lambda: self._wake or not self.is_running, self.poll_interval)
+                self._wake = False
+
+    def _upload(self, rows: List[Dict]):
+        self.client.table(self.table).upsert(rows, ignore_duplicates=True).execute()
@@ -0,0 +1,120 @@
+import threading
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+class BatchLogWriter:
+    OVERFLOW_POLICIES = ("drop_oldest", "drop_newest")
+
+    def __init__(self, client, table: str = 'system_logs', max_batch: int = 50,
+                 flush_interval: float = 1.0, max_queue: int = 1000, max_retries: int = 5,
+                 backoff_base: float = 0.5, backoff_max: float = 30.0, overflow: str = "drop_oldest"):
+        if overflow not in self.OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+
+        self.client = client
+        self.table = table
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.overflow = overflow
+
+        self.pending = deque()
+        self.condition = threading.Condition()
+        self.in_flight = 0
+        self.dropped = 0
+        self.failed = 0
+        self.written = 0
+        self.is_running = True
+        self._flush_requested = False
+        self._stopping = threading.Event()
+
+        self.thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self.thread.start()
+
+    def submit(self, entry: Dict) -> bool:
+        with self.condition:
+            if not self.is_running:
+                return False
+
+            if len(self.pending) >= self.max_queue:
+                self.dropped += 1
+                if self.overflow == "drop_newest":
+                    return False
+                self.pending.popleft()
+
+            self.pending.append(entry)
+            if len(self.pending) >= self.max_batch:
+                self.condition.notify_all()
+            return True
+
+    def queue_depth(self) -> int:
+        with self.condition:
+            return len(self.pending)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        with self.condition:
+            self._flush_requested = True
+            self.condition.notify_all()
+            return self.condition.wait_for(lambda: not self.pending and not self.in_flight, timeout)
+
+    def stop(self, timeout: float = 5.0) -> bool:
+        with self.condition:
+            self.is_running = False
+            self.condition.notify_all()
+        self._stopping.set()
+
+        self.thread.join(timeout)
+        return not self.thread.is_alive()
+
+    def _next_batch(self) -> List[Dict]:
+        with self.condition:
+            deadline = time.monotonic() + self.flush_interval
+            while self.is_running and not self._flush_requested and len(self.pending) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.condition.wait(remaining)
+
+            batch = [self.pending.popleft() for _ in range(min(self.max_batch, len(self.pending)))]
+            self.in_flight = len(batch)
+            if not self.pending:
+                self._flush_requested = False
+            return batch
+
+    def _writer_loop(self):
+        while True:
+            batch = self._next_batch()
+
+            if batch:
+                self._write_with_retry(batch)
+
+            with self.condition:
+                self.in_flight = 0
+                self.condition.notify_all()
+                if not self.is_running and not self.pending:
+                    return
+
+    def _write_with_retry(self, batch: List[Dict]) -> bool:
+        attempt = 0
+        while True:
+            try:
+                self._write(batch)
+                self.written += len(batch)
+                return True
+            except Exception as e:
+                attempt += 1
+                if attempt > self.max_retries:
+                    print(f"Failed to log to Supabase, dropping {len(batch)} entries: {e}")
+                    self.failed += len(batch)
+                    return False
+
+                delay = min(self.backoff_base * (2 ** (attempt - 1)), self.backoff_max)
+                print(f"Failed to log to Supabase (attempt {attempt}), retrying in {delay:.1f}s: {e}")
+                self._stopping.wait(delay)
+
+    def _write(self, batch: List[Dict]):
+        self.client.table(self.table).insert(batch).execute()
@@ -0,0 +1,241 @@
+import os
+import queue
+import threading
+import time
+import cv2
+import numpy as np
+from collections import deque
+from datetime import datetime
+from typing import Deque, List, Optional, Tuple
+
+class EventClip:
+    def __init__(self, kind: str, path: str, ends_at: float):
+        self.kind = kind
+        self.path = path
+        self.ends_at = ends_at
+        self.last_written = float('-inf')
+        self.writer: Optional[cv2.VideoWriter] = None
+
+class LoopRecorder:
+    def __init__(self, directory: str = 'recordings', segment_seconds: float = 60.0, fps: Optional[float] = None,
+                 quota_bytes: int = 2 * 1024 ** 3, pre_event_seconds: float = 10.0,
+                 post_event_seconds: float = 10.0, jpeg_quality: int = 80, codec: str = 'mp4v',
+                 max_queue: int = 8, fps_samples: int = 15, default_fps: float = 30.0):
+        self.directory = directory
+        self.segment_seconds = segment_seconds
+        self.fps = fps
+        self.fps_samples = fps_samples
+        self.default_fps = default_fps
+        self.frame_interval: Optional[float] = None
+        self.interval_samples = 0
+        self.last_timestamp: Optional[float] = None
+        self.held: List[Tuple[float, np.ndarray]] = []
+        self.quota_bytes = quota_bytes
+        self.pre_event_seconds = pre_event_seconds
+        self.post_event_seconds = post_event_seconds
+        self.jpeg_params = [cv2.IMWRITE_JPEG_QUALITY, jpeg_quality]
+        self.fourcc = cv2.VideoWriter_fourcc(*codec)
+
+        self.frames: queue.Queue = queue.Queue(maxsize=max_queue)
+        self.pre_event: Deque[Tuple[float, bytes]] = deque()
+        self.events: List[EventClip] = []
+        self.pending_events: queue.Queue = queue.Queue()
+        self.deferred_events: List[Tuple[str, float]] = []
+
+        self.segment_writer: Optional[cv2.VideoWriter] = None
+        self.segment_started = 0.0
+        self.segment_path: Optional[str] = None
+        self.frame_size: Optional[Tuple[int, int]] = None
+
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self.segments_deleted = 0
+        self.is_running = True
+
+        os.makedirs(directory, exist_ok=True)
+        self.thread = threading.Thread(target=self._encoder_loop, daemon=True)
+        self.thread.start()
+
+    def submit(self, frame: np.ndarray, timestamp: Optional[float] = None) -> bool:
+        if not self.is_running:
+            return False
+
+        if self.frames.full():
+            self.frames_dropped += 1
+            return False
+
+        try:
+            self.frames.put_nowait((time.monotonic() if timestamp is None else timestamp, frame.copy()))
+            return True
+        except queue.Full:
+            self.frames_dropped += 1
+            return False
+
+    def trigger_event(self, kind: str, timestamp: Optional[float] = None):
+        self.pending_events.put((kind, time.monotonic() if timestamp is None else timestamp))
+
+    def queue_depth(self) -> int:
+        return self.frames.qsize()
+
+    def _encoder_loop(self):
+        while self.is_running or not self.frames.empty():
+            try:
+                timestamp, frame = self.frames.get(timeout=0.5)
+            except queue.Empty:
+                self._start_events()
+                continue
+
+            try:
+                self._encode(timestamp, frame)
+            except Exception as e:
+                print(f"Loop recorder encode error: {e}")
+
+        self._flush_held()
+        self._start_events()
+        if self.deferred_events:
+            kinds = ", ".join(kind for kind, _ in self.deferred_events)
+            print(f"Loop recorder dropped events before the first frame: {kinds}")
+        self._close_segment()
+        self._close_events()
+
+    def _measure_interval(self, timestamp: float):
+        if self.last_timestamp is not None and timestamp > self.last_timestamp:
+            interval = timestamp - self.last_timestamp
+            if self.frame_interval is None:
+                self.frame_interval = interval
+            else:
+                self.frame_interval += (interval - self.frame_interval) * 0.1
+            self.interval_samples += 1
+        self.last_timestamp = timestamp
+
+    def current_fps(self) -> float:
+        if self.fps:
+            return self.fps
+        if self.frame_interval:
+            return min(max(1.0 / self.frame_interval, 1.0), 120.0)
+        return self.default_fps
+
+    def _encode(self, timestamp: float, frame: np.ndarray):
+        self._measure_interval(timestamp)
+
+        if not self.fps and self.segment_writer is None and self.interval_samples < self.fps_samples:
+            self.held.append((timestamp, frame))
+            return
+
+        self._flush_held()
+        self._write(timestamp, frame)
+
+    def _flush_held(self):
+        held, self.held = self.held, []
+        for timestamp, frame in held:
+            self._write(timestamp, frame)
+
+    def _write(self, timestamp: float, frame: np.ndarray):
+        height, width = frame.shape[:2]
+        if self.frame_size != (width, height):
+            self._close_segment()
+            self._close_events()
+            self.pre_event.clear()
+            self.frame_size = (width, height)
+
+        if self.segment_writer is None or timestamp - self.segment_started >= self.segment_seconds:
+            self._rotate_segment(timestamp)
+
+        self.segment_writer.write(frame)
+        self.frames_written += 1
+
+        ok, encoded = cv2.imencode('.jpg', frame, self.jpeg_params)
+        if ok:
+            self.pre_event.append((timestamp, encoded.tobytes()))
+        while self.pre_event and timestamp - self.pre_event[0][0] > self.pre_event_seconds:
+            self.pre_event.popleft()
+
+        self._start_events()
+
+        for clip in list(self.events):
+            if timestamp > clip.ends_at:
+                self._close_event(clip)
+                self.events.remove(clip)
+            elif timestamp > clip.last_written:
+                clip.writer.write(frame)
+                clip.last_written = timestamp
+
+    def _start_events(self):
+        while True:
+            try:
+                self.deferred_events.append(self.pending_events.get_nowait())
+            except queue.Empty:
+                break
+
+        if self.frame_size is None:
+            return
+
+        deferred, self.deferred_events = self.deferred_events, []
+        for kind, triggered in deferred:
+            existing = next((clip for clip in self.events if clip.kind == kind), None)
+            if existing is not None:
+                existing.ends_at = max(existing.ends_at, triggered + self.post_event_seconds)
+                continue
+
+            stamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:-3]
+            clip = EventClip(kind, os.path.join(self.directory, f"event_{kind}_{stamp}.mp4"),
+                             triggered + self.post_event_seconds)
+            clip.writer = cv2.VideoWriter(clip.path, self.fourcc, self.current_fps(), self.frame_size)
+
+            for buffered_at, encoded in self.pre_event:
+                decoded = cv2.imdecode(np.frombuffer(encoded, dtype=np.uint8), cv2.IMREAD_COLOR)
+                if decoded is not None:
+                    clip.writer.write(decoded)
+                    clip.last_written = buffered_at
+            self.events.append(clip)
+
+    def _rotate_segment(self, timestamp: float):
+        self._close_segment()
+
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')[:-3]
+        self.segment_path = os.path.join(self.directory, f"segment_{stamp}.mp4")
+        self.segment_writer = cv2.VideoWriter(self.segment_path, self.fourcc, self.current_fps(), self.frame_size)
+        self.segment_started = timestamp
+
+    def _close_segment(self):
+        if self.segment_writer is not None:
+            self.segment_writer.release()
+            self.segment_writer = None
+            self.enforce_quota()
+
+    def _close_event(self, clip: EventClip):
+        if clip.writer is not None:
+            clip.writer.release()
+            clip.writer = None
+        self.enforce_quota()
+
+    def _close_events(self):
+        events, self.events = self.events, []
+        for clip in events:
+            self._close_event(clip)
+
+    def enforce_quota(self):
+        files = []
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.startswith(('segment_', 'event_')) and os.path.isfile(path):
+                files.append((not name.startswith('segment_'), os.path.getmtime(path), path))
+
+        open_paths = {clip.path for clip in self.events}
+        if self.segment_writer is not None:
+            open_paths.add(self.segment_path)
+
+        total = sum(os.path.getsize(path) for _, _, path in files)
+        for _, _, path in sorted(files):
+            if total <= self.quota_bytes:
+                break
+            if path in open_paths:
+                continue
+            size = os.path.getsize(path)
+            os.remove(path)
+            total -= size
+            self.segments_deleted += 1
+
+    def stop(self, timeout: float = 5.0):
+        self.is_running = False
+        self.thread.join(timeout)
@@ -0,0 +1,231 @@
+import bisect
+import os
+import threading
+import time
+import cv2
+from typing import Callable, Dict, List, Optional, Tuple
+
+LATENCY_BUCKETS_MS = (0.1, 0.25, 0.5, 1.0, 2.0, 4.0, 8.0, 16.0, 33.0, 50.0, 100.0, 250.0, 500.0, 1000.0)
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if seen + count >= rank and count:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else self.buckets[-1]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+class LoopRate:
+    def __init__(self, smoothing: float = 0.1):
+        self.smoothing = smoothing
+        self.last: Optional[float] = None
+        self.rate_hz = 0.0
+        self.iterations = 0
+
+    def tick(self, now: float):
+        self.iterations += 1
+        if self.last is not None and now > self.last:
+            rate = 1.0 / (now - self.last)
+            self.rate_hz = rate if self.rate_hz == 0.0 else self.rate_hz + self.smoothing * (rate - self.rate_hz)
+        self.last = now
+
+class _NullTimer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+class _StageTimer:
+    def __init__(self, registry: 'MetricsRegistry', name: str):
+        self.registry = registry
+        self.name = name
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.registry.observe(self.name, (time.perf_counter() - self.started) * 1000.0)
+        return False
+
+NULL_TIMER = _NullTimer()
+
+class MetricsRegistry:
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self.loops: Dict[str, LoopRate] = {}
+        self.gauges: Dict[str, Callable[[], float]] = {}
+        self.lock = threading.Lock()
+
+    def timer(self, name: str):
+        if not self.enabled:
+            return NULL_TIMER
+        return _StageTimer(self, name)
+
+    def observe(self, name: str, value_ms: float):
+        if not self.enabled:
+            return
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.observe(value_ms)
+
+    def increment(self, name: str, amount: int = 1):
+        if not self.enabled:
+            return
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def tick(self, loop: str):
+        if not self.enabled:
+            return
+        with self.lock:
+            rate = self.loops.get(loop)
+            if rate is None:
+                rate = self.loops[loop] = LoopRate()
+            rate.tick(time.monotonic())
+
+    def register_gauge(self, name: str, read: Callable[[], float]):
+        self.gauges[name] = read
+
+    def read_gauges(self) -> Dict[str, float]:
+        values = {}
+        for name, read in list(self.gauges.items()):
+            try:
+                values[name] = float(read())
+            except Exception:
+                continue
+        return values
+
+    def stage_summary(self) -> List[Tuple[str, float, float, int]]:
+        with self.lock:
+            return [(name, h.quantile(0.5), h.quantile(0.95), h.count)
+                    for name, h in sorted(self.histograms.items())]
+
+    def prometheus_text(self, prefix: str = 'rearview') -> str:
+        lines = []
+        with self.lock:
+            if self.histograms:
+                lines.append(f"# TYPE {prefix}_stage_duration_ms histogram")
+            for name, histogram in sorted(self.histograms.items()):
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{prefix}_stage_duration_ms_bucket{{stage="{name}",le="{bound}"}} {cumulative}')
+                lines.append(f'{prefix}_stage_duration_ms_bucket{{stage="{name}",le="+Inf"}} {histogram.count}')
+                lines.append(f'{prefix}_stage_duration_ms_sum{{stage="{name}"}} {histogram.total:.3f}')
+                lines.append(f'{prefix}_stage_duration_ms_count{{stage="{name}"}} {histogram.count}')
+
+            for name, value in sorted(self.counters.items()):
+                lines.append(f"# TYPE {prefix}_{name}_total counter")
+                lines.append(f"{prefix}_{name}_total {value}")
+
+            if self.loops:
+                lines.append(f"# TYPE {prefix}_loop_rate_hz gauge")
+            for name, loop in sorted(self.loops.items()):
+                lines.append(f'{prefix}_loop_rate_hz{{loop="{name}"}} {loop.rate_hz:.2f}')
+            if self.loops:
+                lines.append(f"# TYPE {prefix}_loop_iterations_total counter")
+            for name, loop in sorted(self.loops.items()):
+                lines.append(f'{prefix}_loop_iterations_total{{loop="{name}"}} {loop.iterations}')
+
+        for name, value in sorted(self.read_gauges().items()):
+            lines.append(f"# TYPE {prefix}_{name} gauge")
+            lines.append(f"{prefix}_{name} {value:g}")
+
+        return "\n".join(lines) + "\n"
+
+    def reset(self):
+        with self.lock:
+            self.histograms.clear()
+            self.counters.clear()
+            self.loops.clear()
+
+metrics = MetricsRegistry(os.getenv('METRICS_ENABLED', '').lower() in ('1', 'true', 'yes'))
+
+class MetricsExporter:
+    def __init__(self, registry: MetricsRegistry, path: str, interval: float = 5.0):
+        self.registry = registry
+        self.path = path
+        self.interval = interval
+        self._stopping = threading.Event()
+        threading.Thread(target=self._export_loop, daemon=True).start()
+
+    def _export_loop(self):
+        while not self._stopping.wait(self.interval):
+            self.export()
+
+    def export(self):
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temporary = f"{self.path}.tmp"
+            with open(temporary, 'w') as handle:
+                handle.write(self.registry.prometheus_text())
+            os.replace(temporary, self.path)
+        except OSError as e:
+            print(f"Metrics export to {self.path} failed: {e}")
+
+    def stop(self):
+        self._stopping.set()
+        self.export()
+
+class PerformanceHUD:
+    def __init__(self, registry: MetricsRegistry, refresh_interval: float = 0.5):
+        self.registry = registry
+        self.refresh_interval = refresh_interval
+        self.lines: List[str] = []
+        self.refreshed = 0.0
+
+    def _refresh(self, now: float):
+        lines = [f"{name[:14]:<14} p50 {p50:6.1f}  p95 {p95:6.1f} ms"
+                 for name, p50, p95, _ in self.registry.stage_summary()]
+        with self.registry.lock:
+            lines += [f"{name[:14]:<14} {loop.rate_hz:6.1f} Hz" for name, loop in sorted(self.registry.loops.items())]
+            lines += [f"{name[:14]:<14} {value}" for name, value in sorted(self.registry.counters.items())]
+        lines += [f"{name[:14]:<14} {value:g}" for name, value in sorted(self.registry.read_gauges().items())]
+
+        self.lines = lines
+        self.refreshed = now
+
+    def draw(self, frame):
+        now = time.monotonic()
+        if now - self.refreshed >= self.refresh_interval:
+            self._refresh(now)
+
+        if not self.lines:
+            return frame
+
+        height = 18 * len(self.lines) + 10
+        width = min(frame.shape[1], 330)
+        top = 70
+        panel = frame[top:top + height, :width]
+        cv2.addWeighted(panel, 0.35, panel, 0, 0, dst=panel)
+
+        for index, line in enumerate(self.lines):
+            cv2.putText(frame, line, (8, top + 18 * (index + 1)), cv2.FONT_HERSHEY_PLAIN, 1.0, (0, 255, 170), 1)
+        return frame
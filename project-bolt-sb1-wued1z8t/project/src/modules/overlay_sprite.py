@@ -0,0 +1,42 @@
+import cv2
+import numpy as np
+from typing import Tuple
+
+class OverlaySprite:
+    BANNER_HEIGHT = 61
+    BANNER_COLOR = (10, 10, 10)
+    BANNER_OPACITY = 0.7
+
+    def __init__(self, text: str, color: tuple, width: int, height: int):
+        self.key = (text, color, width, height)
+        ink, coverage = self._render(text, color, width, min(self.BANNER_HEIGHT, height))
+
+        coverage = coverage[:, :, None].astype(np.float32) / 255.0
+        banner = (1.0 - coverage) * self.BANNER_OPACITY
+        alpha = coverage + banner
+
+        self._inverse_alpha = 1.0 - alpha
+        self._premultiplied = ink.astype(np.float32) + banner * np.float32(self.BANNER_COLOR) + 0.5
+        self._scratch = np.empty(self._premultiplied.shape, dtype=np.float32)
+
+        bgr = np.clip(self._premultiplied / np.maximum(alpha, 1e-6), 0, 255).astype(np.uint8)
+        self.bgra = np.dstack((bgr, np.round(alpha * 255).astype(np.uint8)))
+
+    def _render(self, text: str, color: tuple, width: int, height: int) -> Tuple[np.ndarray, np.ndarray]:
+        ink = np.zeros((height, width, 3), dtype=np.uint8)
+        coverage = np.zeros((height, width), dtype=np.uint8)
+
+        for canvas, text_color, dot_color, rec_color in ((ink, color, (0, 0, 255), (255, 255, 255)),
+                                                         (coverage, 255, 255, 255)):
+            cv2.putText(canvas, text, (20, 40), cv2.FONT_HERSHEY_DUPLEX, 1.2, text_color, 2)
+            cv2.circle(canvas, (width - 30, 30), 8, dot_color, -1)
+            cv2.putText(canvas, "REC", (width - 80, 38), cv2.FONT_HERSHEY_SIMPLEX, 0.6, rec_color, 2)
+
+        return ink, coverage
+
+    def blend_into(self, frame: np.ndarray) -> np.ndarray:
+        banner = frame[:self.bgra.shape[0]]
+        np.multiply(banner, self._inverse_alpha, out=self._scratch)
+        self._scratch += self._premultiplied
+        np.copyto(banner, self._scratch, casting='unsafe')
+        return frame
@@ -0,0 +1,136 @@
+import heapq
+import itertools
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+class SpeechMessage:
+    def __init__(self, text: str, priority: int, key: Optional[str], ttl: float, now: float):
+        self.text = text
+        self.priority = priority
+        self.key = key
+        self.enqueued = now
+        self.expires = now + ttl
+        self.cancelled = False
+
+    def expired(self, now: float) -> bool:
+        return now > self.expires
+
+class SpeechQueue:
+    def __init__(self, default_ttl: float = 5.0, max_depth: int = 32):
+        self.default_ttl = default_ttl
+        self.max_depth = max_depth
+        self._heap: List[Tuple[int, int, SpeechMessage]] = []
+        self._by_key: Dict[str, SpeechMessage] = {}
+        self._order = itertools.count()
+        self._live = 0
+        self.condition = threading.Condition()
+
+        self.replaced = 0
+        self.expired = 0
+        self.overflowed = 0
+
+    def put(self, text: str, priority: int = 0, key: Optional[str] = None,
+            ttl: Optional[float] = None) -> SpeechMessage:
+        now = time.monotonic()
+        message = SpeechMessage(text, priority, key, self.default_ttl if ttl is None else ttl, now)
+
+        with self.condition:
+            if key is not None:
+                previous = self._by_key.get(key)
+                if previous is not None and not previous.cancelled:
+                    self._cancel(previous)
+                    self.replaced += 1
+                self._by_key[key] = message
+
+            heapq.heappush(self._heap, (-priority, next(self._order), message))
+            self._live += 1
+
+            if self._live > self.max_depth:
+                self._purge(now)
+            if self._live > self.max_depth:
+                self._drop_lowest()
+
+            self.condition.notify()
+        return message
+
+    def get(self, timeout: Optional[float] = None) -> Optional[SpeechMessage]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self.condition:
+            while True:
+                message = self._pop_live(time.monotonic())
+                if message is not None:
+                    return message
+
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return None
+                self.condition.wait(remaining)
+
+    def highest_priority(self) -> Optional[int]:
+        with self.condition:
+            now = time.monotonic()
+            while self._heap:
+                message = self._heap[0][2]
+                if message.cancelled:
+                    heapq.heappop(self._heap)
+                elif message.expired(now):
+                    heapq.heappop(self._heap)
+                    self._cancel(message)
+                    self.expired += 1
+                else:
+                    return message.priority
+            return None
+
+    def depth(self) -> int:
+        with self.condition:
+            self._purge(time.monotonic())
+            return self._live
+
+    def clear(self):
+        with self.condition:
+            self._heap.clear()
+            self._by_key.clear()
+            self._live = 0
+
+    def _pop_live(self, now: float) -> Optional[SpeechMessage]:
+        while self._heap:
+            message = heapq.heappop(self._heap)[2]
+            if message.cancelled:
+                continue
+
+            self._cancel(message)
+            if message.expired(now):
+                self.expired += 1
+                continue
+            return message
+        return None
+
+    def _purge(self, now: float):
+        live = []
+        for entry in self._heap:
+            message = entry[2]
+            if message.cancelled:
+                continue
+            if message.expired(now):
+                self._cancel(message)
+                self.expired += 1
+                continue
+            live.append(entry)
+
+        if len(live) != len(self._heap):
+            heapq.heapify(live)
+            self._heap = live
+
+    def _drop_lowest(self):
+        live = [entry for entry in self._heap if not entry[2].cancelled]
+        lowest = max(live, key=lambda entry: (entry[0], -entry[1]))
+        self._cancel(lowest[2])
+        self.overflowed += 1
+
+    def _cancel(self, message: SpeechMessage):
+        message.cancelled = True
+        self._live -= 1
+        if message.key is not None and self._by_key.get(message.key) is message:
+            del self._by_key[message.key]
@@ -0,0 +1,138 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence
+
+PENDING = "pending"
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+class Subsystem:
+    def __init__(self, name: str, factory: Callable[[], object], depends: Sequence[str],
+                 cleanup: Optional[Callable[[object], None]] = None):
+        self.name = name
+        self.factory = factory
+        self.depends = tuple(depends)
+        self.cleanup = cleanup
+        self.state = PENDING
+        self.value = None
+        self.error: Optional[Exception] = None
+        self.started = 0.0
+        self.finished = 0.0
+        self.done = threading.Event()
+        self.callbacks: List[Callable[[object], None]] = []
+
+    @property
+    def elapsed_ms(self) -> float:
+        if not self.finished:
+            return 0.0
+        return (self.finished - self.started) * 1000.0
+
+class StartupManager:
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max_workers
+        self.subsystems: Dict[str, Subsystem] = {}
+        self.lock = threading.Lock()
+        self.created = time.perf_counter()
+        self.milestones: Dict[str, float] = {}
+        self.on_complete: Optional[Callable[[], None]] = None
+        self.stopping = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def register(self, name: str, factory: Callable[[], object], depends: Sequence[str] = (),
+                 cleanup: Optional[Callable[[object], None]] = None):
+        self.subsystems[name] = Subsystem(name, factory, depends, cleanup)
+
+    def mark(self, milestone: str):
+        self.milestones[milestone] = (time.perf_counter() - self.created) * 1000.0
+
+    def start(self):
+        self.mark('initializers_started')
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="startup")
+        for subsystem in self.subsystems.values():
+            self._executor.submit(self._load, subsystem)
+        self._executor.shutdown(wait=False)
+
+    def _load(self, subsystem: Subsystem):
+        for dependency in subsystem.depends:
+            self.subsystems[dependency].done.wait()
+
+        subsystem.started = time.perf_counter()
+        if not self.stopping:
+            subsystem.state = LOADING
+            try:
+                subsystem.value = subsystem.factory()
+                subsystem.state = READY
+            except Exception as e:
+                subsystem.error = e
+                subsystem.state = FAILED
+                print(f"Startup of {subsystem.name} failed: {e}")
+        subsystem.finished = time.perf_counter()
+
+        abandoned = None
+        with self.lock:
+            if self.stopping and subsystem.state != FAILED:
+                abandoned, subsystem.value = subsystem.value, None
+                subsystem.state = CANCELLED
+            subsystem.done.set()
+            callbacks, subsystem.callbacks = subsystem.callbacks, []
+            complete = all(s.done.is_set() for s in self.subsystems.values())
+
+        if abandoned is not None and subsystem.cleanup is not None:
+            try:
+                subsystem.cleanup(abandoned)
+            except Exception as e:
+                print(f"Cleanup of {subsystem.name} failed: {e}")
+
+        for callback in callbacks:
+            self._run_callback(subsystem, callback)
+
+        if complete:
+            self.mark('all_ready')
+            if self.on_complete:
+                self.on_complete()
+
+    def _run_callback(self, subsystem: Subsystem, callback: Callable[[object], None]):
+        try:
+            callback(subsystem.value)
+        except Exception as e:
+            print(f"Startup callback for {subsystem.name} failed: {e}")
+
+    def on_ready(self, name: str, callback: Callable[[object], None]):
+        subsystem = self.subsystems[name]
+        with self.lock:
+            if not subsystem.done.is_set():
+                subsystem.callbacks.append(callback)
+                return
+        self._run_callback(subsystem, callback)
+
+    def stop(self):
+        with self.lock:
+            self.stopping = True
+
+    def wait(self, name: str, timeout: Optional[float] = None):
+        subsystem = self.subsystems.get(name)
+        if subsystem is None or not subsystem.done.wait(timeout):
+            return None
+        return subsystem.value
+
+    def is_ready(self, name: str) -> bool:
+        subsystem = self.subsystems.get(name)
+        return subsystem is not None and subsystem.state == READY
+
+    def states(self) -> Dict[str, str]:
+        return {name: subsystem.state for name, subsystem in self.subsystems.items()}
+
+    def pending(self) -> List[str]:
+        return [name for name, subsystem in self.subsystems.items() if not subsystem.done.is_set()]
+
+    def report(self) -> str:
+        lines = ["Startup timing:"]
+        for milestone, at_ms in sorted(self.milestones.items(), key=lambda item: item[1]):
+            lines.append(f"  {milestone:<22} at {at_ms:8.1f} ms")
+        for name, subsystem in self.subsystems.items():
+            offset = (subsystem.started - self.created) * 1000.0 if subsystem.started else 0.0
+            lines.append(f"  {name:<22} {subsystem.state:<8} {subsystem.elapsed_ms:8.1f} ms (from {offset:.1f} ms)")
+        return "\n".join(lines)
@@ -0,0 +1,116 @@
+import threading
+import time
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+from modules.metrics import metrics
+
+class PeriodicTask:
+    def __init__(self, interval: float, callback: Callable[[], None]):
+        self.interval = interval
+        self.callback = callback
+        self.due = 0.0
+
+class UIDispatcher:
+    def __init__(self, root, rate_hz: float = 60.0):
+        self.root = root
+        self.interval_ms = max(1, int(1000 / rate_hz))
+        self.lock = threading.Lock()
+        self.pending_options: Dict[object, Dict] = {}
+        self.pending_calls: Dict[Hashable, Tuple[Callable, tuple]] = {}
+        self.applied: Dict[int, Dict] = {}
+        self.tasks: List[PeriodicTask] = []
+        self._after_id: Optional[str] = None
+        self.is_running = False
+
+        self.posted = 0
+        self.coalesced = 0
+        self.skipped = 0
+        self.applied_count = 0
+
+    def configure(self, widget, **options):
+        with self.lock:
+            self.posted += 1
+            pending = self.pending_options.get(widget)
+            if pending is None:
+                self.pending_options[widget] = options
+            else:
+                self.coalesced += 1
+                pending.update(options)
+
+    def post(self, key: Hashable, callback: Callable, *args):
+        with self.lock:
+            self.posted += 1
+            if key in self.pending_calls:
+                self.coalesced += 1
+            self.pending_calls[key] = (callback, args)
+
+    def every(self, interval: float, callback: Callable[[], None]) -> PeriodicTask:
+        task = PeriodicTask(interval, callback)
+        self.tasks.append(task)
+        return task
+
+    def start(self):
+        self.is_running = True
+        self._after_id = self.root.after(self.interval_ms, self._tick)
+
+    def stop(self):
+        self.is_running = False
+        if self._after_id is not None:
+            try:
+                self.root.after_cancel(self._after_id)
+            except Exception:
+                pass
+            self._after_id = None
+
+    def _tick(self):
+        if not self.is_running:
+            return
+
+        with metrics.timer('ui_tick'):
+            self._apply_pending()
+            self._run_tasks(time.monotonic())
+        metrics.tick('ui_tick')
+
+        self._after_id = self.root.after(self.interval_ms, self._tick)
+
+    def _apply_pending(self):
+        with self.lock:
+            options, self.pending_options = self.pending_options, {}
+            calls, self.pending_calls = self.pending_calls, {}
+
+        for widget, values in options.items():
+            last = self.applied.setdefault(id(widget), {})
+            changed = {name: value for name, value in values.items() if last.get(name) != value}
+            if not changed:
+                self.skipped += 1
+                continue
+            try:
+                widget.configure(**changed)
+                last.update(changed)
+                self.applied_count += 1
+            except Exception as e:
+                print(f"UI update failed: {e}")
+
+        for callback, args in calls.values():
+            try:
+                callback(*args)
+                self.applied_count += 1
+            except Exception as e:
+                print(f"UI callback failed: {e}")
+
+    def _run_tasks(self, now: float):
+        for task in self.tasks:
+            if now < task.due:
+                continue
+            task.due = now + task.interval
+            try:
+                task.callback()
+            except Exception as e:
+                print(f"UI task failed: {e}")
+
+    def stats(self) -> Dict:
+        return {
+            'posted': self.posted,
+            'coalesced': self.coalesced,
+            'skipped': self.skipped,
+            'applied': self.applied_count
+        }
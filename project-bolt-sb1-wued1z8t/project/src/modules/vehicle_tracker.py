@@ -0,0 +1,193 @@
+import time
+from typing import Dict, List, Optional, Tuple
+
+def box_iou(a: Tuple[float, float, float, float], b: Tuple[float, float, float, float]) -> float:
+    ax, ay, aw, ah = a
+    bx, by, bw, bh = b
+    ix = max(0.0, min(ax + aw, bx + bw) - max(ax, bx))
+    iy = max(0.0, min(ay + ah, by + bh) - max(ay, by))
+    intersection = ix * iy
+    union = aw * ah + bw * bh - intersection
+    return intersection / union if union > 0 else 0.0
+
+class VehicleTrack:
+    def __init__(self, track_id: int, detection: Dict, now: float):
+        self.track_id = track_id
+        self.cx = float(detection['x'] + detection['w'] / 2)
+        self.cy = float(detection['y'] + detection['h'] / 2)
+        self.w = float(detection['w'])
+        self.h = float(detection['h'])
+        self.vx = 0.0
+        self.vy = 0.0
+        self.vh = 0.0
+        self.area = float(detection['area'])
+        self.confidence = float(detection['confidence'])
+        self.hits = 1
+        self.misses = 0
+        self.last_predicted = now
+        self.last_detected = now
+
+    def box(self) -> Tuple[float, float, float, float]:
+        return (self.cx - self.w / 2, self.cy - self.h / 2, self.w, self.h)
+
+    def predict(self, now: float):
+        dt = now - self.last_predicted
+        if dt <= 0:
+            return
+        self.cx += self.vx * dt
+        self.cy += self.vy * dt
+        self.h = max(1.0, self.h + self.vh * dt)
+        self.last_predicted = now
+
+    def correct(self, detection: Dict, now: float, smoothing: float):
+        dt = now - self.last_detected
+        cx = float(detection['x'] + detection['w'] / 2)
+        cy = float(detection['y'] + detection['h'] / 2)
+
+        if dt > 0:
+            self.vx += smoothing * (cx - self.cx) / dt
+            self.vy += smoothing * (cy - self.cy) / dt
+            self.vh += smoothing * (detection['h'] - self.h) / dt
+
+        self.cx, self.cy = cx, cy
+        self.w = float(detection['w'])
+        self.h = float(detection['h'])
+        self.area = float(detection['area'])
+        self.confidence = float(detection['confidence'])
+        self.hits += 1
+        self.misses = 0
+        self.last_predicted = now
+        self.last_detected = now
+
+    def approach_rate(self) -> float:
+        return self.vh / self.h if self.h > 0 else 0.0
+
+    def as_dict(self, now: float) -> Dict:
+        x, y, w, h = self.box()
+        return {
+            'x': int(x),
+            'y': int(y),
+            'w': int(w),
+            'h': int(h),
+            'area': self.area,
+            'confidence': self.confidence,
+            'track_id': self.track_id,
+            'vx': self.vx,
+            'vy': self.vy,
+            'approach_rate': self.approach_rate(),
+            'predicted': self.last_detected < now
+        }
+
+class VehicleTracker:
+    def __init__(self, iou_threshold: float = 0.3, max_centroid_distance: float = 60.0,
+                 max_misses: int = 5, min_hits: int = 2, full_scan_interval: int = 10,
+                 search_margin: int = 40, smoothing: float = 0.5):
+        self.iou_threshold = iou_threshold
+        self.max_centroid_distance = max_centroid_distance
+        self.max_misses = max_misses
+        self.min_hits = min_hits
+        self.full_scan_interval = full_scan_interval
+        self.search_margin = search_margin
+        self.smoothing = smoothing
+
+        self.tracks: List[VehicleTrack] = []
+        self.next_id = 1
+        self.detections_since_full_scan = 0
+
+    def predict(self, now: Optional[float] = None):
+        now = time.monotonic() if now is None else now
+        for track in self.tracks:
+            track.predict(now)
+
+    def needs_full_scan(self) -> bool:
+        return not self.tracks or self.detections_since_full_scan >= self.full_scan_interval
+
+    def search_regions(self) -> List[Tuple[int, int, int, int]]:
+        regions = []
+        for track in self.tracks:
+            x, y, w, h = track.box()
+            margin = self.search_margin + max(abs(track.vx), abs(track.vy)) * 0.1
+            regions.append((
+                int(x - margin),
+                int(y - margin),
+                int(w + 2 * margin),
+                int(h + 2 * margin)
+            ))
+        return regions
+
+    def detect(self, context, detector, now: Optional[float] = None) -> List[Dict]:
+        now = time.monotonic() if now is None else now
+        regions = self.scan_regions(now)
+        return self.update_scan(detector.detect_vehicles(context, regions), regions, now)
+
+    def scan_regions(self, now: Optional[float] = None) -> Optional[List[Tuple[int, int, int, int]]]:
+        self.predict(now)
+        return None if self.needs_full_scan() else self.search_regions()
+
+    def update_scan(self, detections, regions: Optional[List[Tuple[int, int, int, int]]],
+                    now: Optional[float] = None) -> List[Dict]:
+        now = time.monotonic() if now is None else now
+        self.predict(now)
+
+        detections = list(detections)
+        if regions is None:
+            self.detections_since_full_scan = 0
+        else:
+            detections = self._deduplicate(detections)
+            self.detections_since_full_scan += 1
+
+        self.update(detections, now)
+        return self.vehicles(now)
+
+    def _deduplicate(self, detections: List[Dict]) -> List[Dict]:
+        unique: List[Dict] = []
+        for detection in sorted(detections, key=lambda d: d['area'], reverse=True):
+            box = (detection['x'], detection['y'], detection['w'], detection['h'])
+            if all(box_iou(box, (u['x'], u['y'], u['w'], u['h'])) < 0.7 for u in unique):
+                unique.append(detection)
+        return unique
+
+    def update(self, detections: List[Dict], now: float):
+        pairs = []
+        for track_index, track in enumerate(self.tracks):
+            track_box = track.box()
+            for detection_index, detection in enumerate(detections):
+                box = (detection['x'], detection['y'], detection['w'], detection['h'])
+                iou = box_iou(track_box, box)
+                if iou >= self.iou_threshold:
+                    pairs.append((1.0 + iou, track_index, detection_index))
+                    continue
+
+                dx = box[0] + box[2] / 2 - track.cx
+                dy = box[1] + box[3] / 2 - track.cy
+                distance = (dx * dx + dy * dy) ** 0.5
+                if distance < self.max_centroid_distance:
+                    pairs.append((1.0 - distance / self.max_centroid_distance, track_index, detection_index))
+
+        matched_tracks = set()
+        matched_detections = set()
+        for _, track_index, detection_index in sorted(pairs, reverse=True):
+            if track_index in matched_tracks or detection_index in matched_detections:
+                continue
+            self.tracks[track_index].correct(detections[detection_index], now, self.smoothing)
+            matched_tracks.add(track_index)
+            matched_detections.add(detection_index)
+
+        for track_index, track in enumerate(self.tracks):
+            if track_index not in matched_tracks:
+                track.misses += 1
+
+        self.tracks = [track for track in self.tracks if track.misses <= self.max_misses]
+
+        for detection_index, detection in enumerate(detections):
+            if detection_index not in matched_detections:
+                self.tracks.append(VehicleTrack(self.next_id, detection, now))
+                self.next_id += 1
+
+    def vehicles(self, now: Optional[float] = None) -> List[Dict]:
+        now = time.monotonic() if now is None else now
+        return [track.as_dict(now) for track in self.tracks if track.hits >= self.min_hits]
+
+    def reset(self):
+        self.tracks = []
+        self.detections_since_full_scan = 0
@@ -1,12 +1,53 @@
+import os
 import threading
-from queue import Queue
-from typing import Optional
+import time
+from collections import deque
+from typing import Dict, Optional
+from modules.audio_cache import PhraseCache
+from modules.metrics import metrics
+from modules.speech_queue import SpeechMessage, SpeechQueue
+
+PRIORITY_INFO = 0
+PRIORITY_NOTICE = 1
+PRIORITY_WARNING = 2
+PRIORITY_CRITICAL = 3
+
+INDICATOR_MESSAGES = {
+    'left': "Left indicator activated. Monitoring side camera.",
+    'right': "Right indicator activated. Monitoring side camera.",
+    'off': "Indicators deactivated. Returning to center view."
+}
+
+REVERSE_MESSAGES = {
+    True: "Reverse gear activated. Rear camera engaged. Keep distance.",
+    False: "Reverse gear disengaged. Returning to normal view."
+}
+
+WARNING_MESSAGES = {
+    'blind_spot_left': "Caution: Vehicle detected in left blind spot.",
+    'blind_spot_right': "Caution: Vehicle detected in right blind spot.",
+    'obstacle_rear': "Warning: Obstacle detected behind vehicle.",
+    'lane_deviation': "Lane deviation detected. Adjust steering."
+}
+
+DEFAULT_WARNING = "Warning detected."
+
+FIXED_PHRASES = (
+    list(INDICATOR_MESSAGES.values()) + list(REVERSE_MESSAGES.values())
+    + list(WARNING_MESSAGES.values()) + [DEFAULT_WARNING]
+)
 
 class VoiceModule:
-    def __init__(self):
-        self.speech_queue = Queue()
+    def __init__(self, default_ttl: float = 5.0, max_depth: int = 32, cache_dir: Optional[str] = None):
+        self.speech_queue = SpeechQueue(default_ttl, max_depth)
+        self.phrase_cache = PhraseCache(cache_dir or os.getenv('VOICE_CACHE_DIR', 'cache/voice'))
+        self.cache_ready = threading.Event()
         self.is_running = False
         self.engine = None
+        self.current: Optional[SpeechMessage] = None
+        self.latencies_ms = deque(maxlen=100)
+        self.spoken = 0
+        self.preempted = 0
         self._initialize_engine()
 
     def _initialize_engine(self):
@@ -20,6 +61,7 @@ class VoiceModule:
             if len(voices) > 1:
                 self.engine.setProperty('voice', voices[1].id)
 
+            self.engine.connect('started-word', self._on_word)
             self.is_running = True
             threading.Thread(target=self._speech_worker, daemon=True).start()
         except Exception as e:
@@ -27,45 +69,102 @@ class VoiceModule:
             self.engine = None
 
     def _speech_worker(self):
+        self._prepare_cache()
+
         while self.is_running:
+            message = self.speech_queue.get(timeout=1)
+            if message is None or not self.engine or not message.text:
+                continue
+
+            self.current = message
+            latency_ms = (time.monotonic() - message.enqueued) * 1000.0
+            self.latencies_ms.append(latency_ms)
+            metrics.observe('speech_latency', latency_ms)
             try:
-                message = self.speech_queue.get(timeout=1)
-                if self.engine and message:
-                    self.engine.say(message)
+                clip = self.phrase_cache.get(message.text, self.engine.getProperty('voice'),
+                                             self.engine.getProperty('rate'))
+                if clip is not None:
+                    self._play_cached(clip)
+                else:
+                    self.engine.say(message.text)
                     self.engine.runAndWait()
-            except:
-                continue
+                self.spoken += 1
+            except Exception as e:
+                print(f"Speech playback failed: {e}")
+            finally:
+                self.current = None
+
+    def _prepare_cache(self):
+        try:
+            rendered = self.phrase_cache.render(self.engine, FIXED_PHRASES, self.engine.getProperty('voice'),
+                                                self.engine.getProperty('rate'))
+            if rendered:
+                print(f"Rendered {rendered} voice phrases to {self.phrase_cache.directory}")
+        except Exception as e:
+            print(f"Voice phrase pre-rendering failed: {e}")
+        finally:
+            self.cache_ready.set()
+
+    def _play_cached(self, clip):
+        playback = self.phrase_cache.play(clip)
+        while playback.is_playing():
+            if self._should_preempt():
+                self.preempted += 1
+                playback.stop()
+                return
+            time.sleep(0.01)
+
+    def _should_preempt(self) -> bool:
+        current = self.current
+        if current is None or current.priority >= PRIORITY_CRITICAL:
+            return False
+
+        pending = self.speech_queue.highest_priority()
+        return pending is not None and pending >= PRIORITY_CRITICAL
+
+    def _on_word(self, name, location, length):
+        if self._should_preempt():
+            self.preempted += 1
+            self.engine.stop()
 
-    def speak(self, message: str):
+    def speak(self, message: str, priority: int = PRIORITY_INFO, key: Optional[str] = None,
+              ttl: Optional[float] = None):
         if self.engine:
-            self.speech_queue.put(message)
+            self.speech_queue.put(message, priority, key, ttl)
         else:
             print(f"[VOICE]: {message}")
 
-    def announce_indicator(self, direction: str):
-        messages = {
-            'left': "Left indicator activated. Monitoring side camera.",
-            'right': "Right indicator activated. Monitoring side camera.",
-            'off': "Indicators deactivated. Returning to center view."
+    def queue_depth(self) -> int:
+        return self.speech_queue.depth()
+
+    def stats(self) -> Dict:
+        latencies = sorted(self.latencies_ms)
+        return {
+            'queue_depth': self.speech_queue.depth(),
+            'spoken': self.spoken,
+            'preempted': self.preempted,
+            'replaced': self.speech_queue.replaced,
+            'expired': self.speech_queue.expired,
+            'overflowed': self.speech_queue.overflowed,
+            'cache_hits': self.phrase_cache.hits,
+            'cache_misses': self.phrase_cache.misses,
+            'latency_ms': latencies[len(latencies) // 2] if latencies else 0.0,
+            'latency_max_ms': latencies[-1] if latencies else 0.0
         }
-        self.speak(messages.get(direction, ""))
+
+    def announce_indicator(self, direction: str):
+        self.speak(INDICATOR_MESSAGES.get(direction, ""), PRIORITY_NOTICE, key='indicator', ttl=3.0)
 
     def announce_reverse(self, engaged: bool):
-        if engaged:
-            self.speak("Reverse gear activated. Rear camera engaged. Keep distance.")
-        else:
-            self.speak("Reverse gear disengaged. Returning to normal view.")
+        priority = PRIORITY_WARNING if engaged else PRIORITY_NOTICE
+        self.speak(REVERSE_MESSAGES[engaged], priority, key='reverse', ttl=3.0)
 
     def announce_warning(self, warning_type: str):
-        warnings = {
-            'blind_spot_left': "Caution: Vehicle detected in left blind spot.",
-            'blind_spot_right': "Caution: Vehicle detected in right blind spot.",
-            'obstacle_rear': "Warning: Obstacle detected behind vehicle.",
-            'lane_deviation': "Lane deviation detected. Adjust steering."
-        }
-        self.speak(warnings.get(warning_type, "Warning detected."))
+        priority = PRIORITY_WARNING if warning_type == 'lane_deviation' else PRIORITY_CRITICAL
+        self.speak(WARNING_MESSAGES.get(warning_type, DEFAULT_WARNING), priority, key=warning_type, ttl=2.5)
 
     def stop(self):
         self.is_running = False
+        self.speech_queue.clear()
         if self.engine:
             self.engine.stop()
@@ -1,17 +1,31 @@
 import customtkinter as ctk
 import cv2
 import numpy as np
-from PIL import Image, ImageTk
+import os
 import threading
 import time
 from modules.camera_handler import CameraHandler
 from modules.voice_module import VoiceModule
-from modules.gps_simulator import GPSSimulator
+from modules.gps_replay import create_gps_source
 from modules.ai_detector import AIDetector
 from modules.data_logger import DataLogger
+from modules.display_renderer import DisplayRenderer
+from modules.detection_worker import DetectionPool, run_detectors
+from modules.detection_scheduler import DetectionScheduler
+from modules.vehicle_tracker import VehicleTracker
+from modules.lane_estimator import LaneEstimator
+from modules.blind_spot_monitor import BlindSpotMonitor, gated_sides
+from modules.metrics import metrics, MetricsExporter, PerformanceHUD
+from modules.frame_source import open_source
+from modules.loop_recorder import LoopRecorder
+from modules.ui_dispatcher import UIDispatcher
+from modules.event_bus import EventBus, IndicatorChanged, ReverseChanged, AIToggled
+from modules.startup import StartupManager, FAILED
 
 class SmartRearViewDashboard:
-    def __init__(self):
+    def __init__(self, display_refresh_hz: float = 60.0, detection_workers: int = 0):
+        self.startup = StartupManager()
+
         ctk.set_appearance_mode("dark")
         ctk.set_default_color_theme("blue")
 
@@ -19,12 +33,13 @@ class SmartRearViewDashboard:
         self.root.title("Smart Rear-View System")
         self.root.geometry("1400x900")
         self.root.configure(fg_color="#0A0A0A")
+        self.ui = UIDispatcher(self.root, display_refresh_hz)
 
-        self.camera = CameraHandler()
-        self.voice = VoiceModule()
-        self.gps = GPSSimulator()
-        self.ai_detector = AIDetector()
-        self.logger = DataLogger()
+        self.camera = None
+        self.voice = None
+        self.gps = None
+        self.ai_detector = None
+        self.logger = None
 
         self.left_indicator_active = False
         self.right_indicator_active = False
@@ -32,10 +47,59 @@ class SmartRearViewDashboard:
         self.ai_enabled = False
         self.is_recording = False
 
+        self.frames_dropped = 0
+        self.frames_stale = 0
+        self.fresh_streak = 0
+        self.copy_frames = False
+        self.display_refresh_hz = display_refresh_hz
+        self.display_latency_ms = 0.0
+        self.video_thread = None
+        self.shutdown_thread = None
+        self.shutdown_timeout = 3.0
+        self.event_wait_timeout = 5.0
+
+        self.detection_workers = detection_workers
+        self.detection_pool = None
+        self.scheduler = DetectionScheduler()
+        self.vehicle_tracker = VehicleTracker()
+        self.lane_estimator = LaneEstimator()
+        self.blind_spot_monitor = BlindSpotMonitor()
+        self.tracked_view = None
+        self.last_lane_warning = 0.0
+        self.last_detections = {
+            'lanes': [],
+            'vehicles': [],
+            'blind_spot': {'warning': False, 'side': None}
+        }
+
+        self.recorder = None
+        self.recording_enabled = os.getenv('RECORDING_ENABLED', 'true').lower() not in ('0', 'false', 'no')
+        self.blind_spot_recorded = False
+
+        self.performance_hud = None
+        if os.getenv('METRICS_HUD', '').lower() in ('1', 'true', 'yes'):
+            self.performance_hud = PerformanceHUD(metrics)
+        self.metrics_exporter = None
+        metrics_file = os.getenv('METRICS_FILE', '')
+        if metrics.enabled and metrics_file:
+            self.metrics_exporter = MetricsExporter(metrics, metrics_file)
+        metrics.register_gauge('speech_queue_depth',
+                               lambda: self.voice.queue_depth() if self.voice is not None else 0)
+        metrics.register_gauge('log_queue_depth',
+                               lambda: self.logger.queue_depth() if self.logger is not None else 0)
+        metrics.register_gauge('recorder_queue_depth',
+                               lambda: self.recorder.queue_depth() if self.recorder is not None else 0)
+        metrics.register_gauge('detection_in_flight',
+                               lambda: self.detection_pool.in_flight() if self.detection_pool is not None else 0)
+
+        self.bus = EventBus()
+        self._subscribe_handlers()
+
         self.blink_state = False
         self.rec_blink_state = False
 
         self._setup_ui()
+        self.startup.mark('ui_built')
         self._start_systems()
 
     def _setup_ui(self):
@@ -185,8 +249,17 @@ class SmartRearViewDashboard:
         )
         self.rec_indicator.pack(side="right", padx=20, pady=15)
 
+        self.latency_label = ctk.CTkLabel(
+            video_header,
+            text="-- ms",
+            font=("Courier", 14),
+            text_color="#888888"
+        )
+        self.latency_label.pack(side="right", padx=10, pady=15)
+
         self.video_label = ctk.CTkLabel(center_panel, text="", fg_color="#000000")
         self.video_label.pack(fill="both", expand=True, padx=0, pady=0)
+        self.renderer = DisplayRenderer(self.video_label)
 
         status_frame = ctk.CTkFrame(center_panel, fg_color="#2A2A2A", height=60, corner_radius=(0, 0, 15, 15))
         status_frame.pack(fill="x")
@@ -194,72 +267,342 @@ class SmartRearViewDashboard:
 
         self.status_label = ctk.CTkLabel(
             status_frame,
-            text="System Ready",
+            text="Starting systems...",
             font=("Segoe UI", 14),
             text_color="#00FFAA"
         )
         self.status_label.pack(pady=18)
 
     def _start_systems(self):
-        self.camera.start_camera(0)
-        self.gps.start()
+        self._register_subsystem('camera', self._open_camera, lambda camera: camera.stop_camera())
+        self._register_subsystem('voice', VoiceModule, lambda voice: voice.stop())
+        self._register_subsystem('gps', self._open_gps, lambda gps: gps.stop())
+        self._register_subsystem('ai_detector', AIDetector)
+        self._register_subsystem('logger', self._open_logger, lambda logger: logger.stop())
+        if self.recording_enabled:
+            self._register_subsystem('recorder', self._open_recorder, lambda recorder: recorder.stop())
+        if self.detection_workers > 0:
+            self._register_subsystem('detection_pool', lambda: DetectionPool(self.detection_workers),
+                                     lambda pool: pool.stop())
+        self.startup.on_complete = self._on_startup_complete
+
         self.is_recording = True
 
-        self.logger.log_system_event("Smart Rear-View System started")
+        self.startup.on_ready('camera', self._start_video_loop)
+        self.ui.every(0.5, self._blink_indicators)
+        self.ui.every(0.8, self._blink_rec)
+        self.ui.start()
+
+        self.root.after_idle(self._begin_startup)
+
+    def _register_subsystem(self, name: str, factory, cleanup=None):
+        self.startup.register(name, factory, cleanup=cleanup)
+        self.startup.on_ready(name, lambda value: setattr(self, name, value))
+        self.startup.on_ready(name, lambda _: self._show_startup_progress())
+
+    def _begin_startup(self):
+        if self.startup.stopping:
+            return
+        self.startup.mark('window_shown')
+        self.startup.start()
+
+    def _open_camera(self):
+        camera = CameraHandler()
+        if self.recording_enabled:
+            camera.set_frame_callback(self._record_frame)
+
+        camera_source = os.getenv('CAMERA_SOURCE', '')
+        if camera_source:
+            loop = os.getenv('CAMERA_SOURCE_LOOP', '').lower() in ('1', 'true', 'yes')
+            camera.start_camera(0, open_source(camera_source, realtime=True, loop=loop))
+        else:
+            camera.start_camera(0)
+        return camera
+
+    def _open_gps(self):
+        gps = create_gps_source()
+        gps.set_update_callback(self._update_gps_display)
+        gps.start()
+        return gps
+
+    def _open_logger(self):
+        logger = DataLogger()
+        logger.log_system_event("Smart Rear-View System started")
+        return logger
+
+    def _open_recorder(self):
+        return LoopRecorder(
+            os.getenv('RECORDING_DIR', 'recordings'),
+            segment_seconds=float(os.getenv('RECORDING_SEGMENT_SECONDS', '60')),
+            quota_bytes=int(float(os.getenv('RECORDING_QUOTA_MB', '2048')) * 1024 * 1024)
+        )
 
-        self.gps.set_update_callback(self._update_gps_display)
+    def _show_startup_progress(self):
+        pending = self.startup.pending()
+        if pending:
+            self.ui.configure(self.status_label, text=f"Starting: {', '.join(pending)}")
 
-        threading.Thread(target=self._update_video_feed, daemon=True).start()
-        threading.Thread(target=self._blink_indicators, daemon=True).start()
-        threading.Thread(target=self._blink_rec, daemon=True).start()
+    def _on_startup_complete(self):
+        print(self.startup.report())
+        if self.startup.stopping:
+            return
 
-    def _update_video_feed(self):
-        while self.is_recording:
-            frame = self.camera.get_current_frame()
+        failed = [name for name, state in self.startup.states().items() if state == FAILED]
+        if failed:
+            self.ui.configure(self.status_label, text=f"System Ready - unavailable: {', '.join(failed)}")
+        else:
+            self.ui.configure(self.status_label, text="System Ready")
+
+        if self.logger is not None:
+            timings = ", ".join(f"{name} {subsystem.elapsed_ms:.0f} ms"
+                                for name, subsystem in self.startup.subsystems.items())
+            self.logger.log_system_event(
+                f"Startup completed in {self.startup.milestones['all_ready']:.0f} ms ({timings})"
+            )
+
+    def _start_video_loop(self, camera):
+        if camera is None:
+            return
+        self.video_thread = threading.Thread(target=self._video_loop, args=(camera,), daemon=True)
+        self.video_thread.start()
+
+    def _video_loop(self, camera):
+        last_sequence = 0
+        frame_interval = 1.0 / self.display_refresh_hz
+        next_present = 0.0
 
+        while self.is_recording:
+            packet = camera.wait_for_frame(last_sequence, timeout=0.5)
+            if packet is None:
+                continue
+
+            now = time.monotonic()
+            if now < next_present:
+                time.sleep(next_present - now)
+                packet = camera.read_frame(last_sequence) or packet
+
+            if last_sequence:
+                dropped = packet.sequence - last_sequence - 1
+                self.frames_dropped += dropped
+                if dropped:
+                    metrics.increment('frames_dropped', dropped)
+            last_sequence = packet.sequence
+
+            copied = self.copy_frames
+            if copied:
+                packet = packet._replace(frame=packet.frame.copy())
+                if not camera.frames.is_valid(packet):
+                    self._frame_stale()
+                    continue
+
+            frame = self._compose_frame(camera, packet, copied)
             if frame is not None:
-                if self.ai_enabled:
-                    lines = self.ai_detector.detect_lane_lines(frame)
-                    frame = self.ai_detector.draw_lane_lines(frame, lines)
-
-                    vehicles = self.ai_detector.detect_vehicles(frame)
-                    frame = self.ai_detector.draw_vehicle_detections(frame, vehicles)
-
-                    blind_spot = self.ai_detector.check_blind_spot(frame, self.camera.current_view)
-                    if blind_spot['warning']:
-                        cv2.putText(frame, "⚠ BLIND SPOT WARNING", (10, frame.shape[0] - 20),
-                                    cv2.FONT_HERSHEY_BOLD, 1, (0, 0, 255), 2)
-
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                img = Image.fromarray(frame_rgb)
-                img = img.resize((1040, 650), Image.Resampling.LANCZOS)
-                imgtk = ImageTk.PhotoImage(image=img)
-
-                self.video_label.configure(image=imgtk)
-                self.video_label.image = imgtk
-
-            time.sleep(0.03)
+                with metrics.timer('display_convert'):
+                    self.renderer.prepare(frame)
+
+            fresh = camera.frames.is_valid(packet)
+            if frame is None or not (fresh or copied):
+                self.renderer.discard()
+                self._frame_stale()
+                continue
+            self._frame_fresh(fresh)
+
+            self.ui.post('video', self._present_video, packet.timestamp)
+            next_present = time.monotonic() + frame_interval
+
+    def _frame_stale(self):
+        self.frames_stale += 1
+        metrics.increment('frames_stale')
+        self.copy_frames = True
+        self.fresh_streak = 0
+
+    def _frame_fresh(self, fresh: bool):
+        self.fresh_streak = self.fresh_streak + 1 if fresh else 0
+        if self.fresh_streak >= 30:
+            self.copy_frames = False
+
+    def _compose_frame(self, camera, packet, copied: bool = False):
+        frame = packet.frame
+
+        detections = None
+        if self.ai_enabled and self.ai_detector is not None:
+            detections = self._run_detection(frame, packet.sequence,
+                                             lambda: copied or camera.frames.is_valid(packet))
+            if detections is None:
+                return None
+
+        if detections is not None:
+            lines, vehicles, blind_spot = detections
+
+            self._record_blind_spot_event(blind_spot['warning'])
+
+            with metrics.timer('draw'):
+                frame = self.ai_detector.draw_lane_lines(frame, lines)
+                frame = self.ai_detector.draw_vehicle_detections(frame, vehicles)
+
+                if blind_spot['warning']:
+                    cv2.putText(frame, "⚠ BLIND SPOT WARNING", (10, frame.shape[0] - 20),
+                                cv2.FONT_HERSHEY_DUPLEX, 1, (0, 0, 255), 2)
+
+        if self.performance_hud is not None:
+            if not frame.flags.writeable:
+                frame = frame.copy()
+            frame = self.performance_hud.draw(frame)
+
+        return frame
+
+    def _present_video(self, captured_at: float):
+        with metrics.timer('tk_update'):
+            self.renderer.present()
+        metrics.tick('display_loop')
+
+        self.display_latency_ms = (time.monotonic() - captured_at) * 1000
+        self.ui.configure(self.latency_label, text=f"{self.display_latency_ms:.0f} ms")
+
+    def _run_detection(self, frame, sequence: int, valid):
+        view = self.camera.current_view
+
+        if view != self.tracked_view:
+            self.vehicle_tracker.reset()
+            self.lane_estimator.reset()
+            self.tracked_view = view
+
+        speed = self.gps.get_speed() if self.gps is not None else 0.0
+        self.scheduler.update_context(view, self.reverse_active, speed)
+        plan = self.scheduler.plan()
+
+        if self.detection_pool is not None:
+            updated = self._run_pooled_detectors(frame, sequence, plan, valid)
+        else:
+            updated = self._run_local_detectors(frame, sequence, plan, valid)
+        if updated is None:
+            return None
+
+        if 'vehicles' not in updated:
+            self.vehicle_tracker.predict()
+            self.last_detections['vehicles'] = self.vehicle_tracker.vehicles()
+
+        self.last_detections['blind_spot'] = self.blind_spot_monitor.state_for(view)
+
+        if 'lanes' in updated and not self.reverse_active:
+            self._check_lane_deviation()
+
+        return self.last_detections['lanes'], self.last_detections['vehicles'], self.last_detections['blind_spot']
+
+    def _detection_requests(self, context, plan):
+        height, width = context.shape[:2]
+        requests = {}
+        gate = None
+        for name in plan:
+            if name == 'lanes':
+                requests[name] = self.lane_estimator.search_polygons(height, width)
+            elif name == 'vehicles':
+                requests[name] = self.vehicle_tracker.scan_regions()
+            elif name == 'blind_spot':
+                gate = self.blind_spot_monitor.gate(context)
+                requests[name] = gated_sides(gate)
+        return requests, gate
+
+    def _run_local_detectors(self, frame, sequence: int, plan, valid):
+        context = self.ai_detector.prepare_frame(frame, sequence)
+        requests, gate = self._detection_requests(context, plan)
+        result = run_detectors(self.ai_detector, context, requests)
+
+        if not valid():
+            return None
+
+        self.scheduler.dispatch(plan)
+        if gate is not None:
+            self.blind_spot_monitor.commit_gate(gate)
+        return self._apply_result(result, frame.shape)
+
+    def _run_pooled_detectors(self, frame, sequence: int, plan, valid):
+        submitted = False
+        gate = None
+        if plan:
+            requests, gate = self._detection_requests(self.ai_detector.prepare_frame(frame, sequence), plan)
+            submitted = self.detection_pool.submit(frame, sequence, requests)
+
+        if not valid():
+            if submitted:
+                self.detection_pool.discard(sequence)
+            return None
+
+        if submitted:
+            self.scheduler.dispatch(plan)
+            if gate is not None:
+                self.blind_spot_monitor.commit_gate(gate)
+
+        updated = set()
+        for result in self.detection_pool.take_results():
+            updated.update(self._apply_result(result, frame.shape))
+        return updated
+
+    def _apply_result(self, result, shape):
+        if result.lines is not None:
+            self.last_detections['lanes'] = self.lane_estimator.update_segments(
+                result.lines, shape, banded=result.requests['lanes'] is not None)
+        if result.vehicles is not None:
+            self.last_detections['vehicles'] = self.vehicle_tracker.update_scan(
+                result.vehicles, result.requests['vehicles'])
+        if result.blind_spot is not None:
+            self.blind_spot_monitor.apply(result.blind_spot)
+
+        for name, elapsed_ms in result.timings.items():
+            self.scheduler.record_cost(name, elapsed_ms)
+            metrics.observe(f'detect_{name}', elapsed_ms)
+        return set(result.timings)
+
+    def _record_frame(self, packet):
+        if self.is_recording and packet is not None and self.recorder is not None:
+            self.recorder.submit(packet.frame, packet.timestamp)
+
+    def _record_blind_spot_event(self, warning: bool):
+        if warning and not self.blind_spot_recorded and self.recorder is not None:
+            self.recorder.trigger_event(f"blind_spot_{self.camera.current_view}")
+        self.blind_spot_recorded = warning
+
+    def _check_lane_deviation(self):
+        now = time.monotonic()
+        if self.lane_estimator.is_deviating() and now - self.last_lane_warning > 10.0:
+            self.last_lane_warning = now
+            if self.voice is not None:
+                self.voice.announce_warning('lane_deviation')
+            if self.logger is not None:
+                self.logger.log_warning('lane_deviation')
 
     def _blink_indicators(self):
-        while self.is_recording:
-            self.blink_state = not self.blink_state
-
-            if self.left_indicator_active:
-                color = "#00FFAA" if self.blink_state else "#2A2A2A"
-                self.left_indicator_btn.configure(fg_color=color)
+        self.blink_state = not self.blink_state
 
-            if self.right_indicator_active:
-                color = "#FF6B00" if self.blink_state else "#2A2A2A"
-                self.right_indicator_btn.configure(fg_color=color)
+        if self.left_indicator_active:
+            color = "#00FFAA" if self.blink_state else "#2A2A2A"
+            self.ui.configure(self.left_indicator_btn, fg_color=color)
 
-            time.sleep(0.5)
+        if self.right_indicator_active:
+            color = "#FF6B00" if self.blink_state else "#2A2A2A"
+            self.ui.configure(self.right_indicator_btn, fg_color=color)
 
     def _blink_rec(self):
-        while self.is_recording:
-            self.rec_blink_state = not self.rec_blink_state
-            color = "#FF0000" if self.rec_blink_state else "#FFFFFF"
-            self.rec_indicator.configure(text_color=color)
-            time.sleep(0.8)
+        if not self.is_recording:
+            return
+        self.rec_blink_state = not self.rec_blink_state
+        color = "#FF0000" if self.rec_blink_state else "#FFFFFF"
+        self.ui.configure(self.rec_indicator, text_color=color)
+
+    def _subscribe_handlers(self):
+        self.bus.subscribe('camera', IndicatorChanged, self._camera_on_indicator)
+        self.bus.subscribe('camera', ReverseChanged, self._camera_on_reverse)
+        self.bus.subscribe('ui', IndicatorChanged, self._ui_on_indicator)
+        self.bus.subscribe('ui', ReverseChanged, self._ui_on_reverse)
+        self.bus.subscribe('ui', AIToggled, self._ui_on_ai)
+        self.bus.subscribe('voice', IndicatorChanged, self._voice_on_indicator)
+        self.bus.subscribe('voice', ReverseChanged, self._voice_on_reverse)
+        self.bus.subscribe('logger', IndicatorChanged, self._logger_on_indicator)
+        self.bus.subscribe('logger', ReverseChanged, self._logger_on_reverse)
+        self.bus.subscribe('logger', AIToggled, self._logger_on_ai)
+        self.bus.subscribe('detection', AIToggled, self._detection_on_ai)
+        if self.recording_enabled:
+            self.bus.subscribe('recorder', ReverseChanged, self._recorder_on_reverse)
 
     def toggle_left_indicator(self):
         self.left_indicator_active = not self.left_indicator_active
@@ -267,17 +610,8 @@ class SmartRearViewDashboard:
         if self.left_indicator_active:
             self.right_indicator_active = False
             self.reverse_active = False
-            self.camera.switch_view("left")
-            self.view_label.configure(text="◄ LEFT CAMERA", text_color="#00FFAA")
-            self.status_label.configure(text="Left indicator ON - Monitoring left side")
-            self.voice.announce_indicator("left")
-            self.logger.log_indicator_change("left", "ON")
-        else:
-            self.camera.switch_view("center")
-            self.view_label.configure(text="CENTER VIEW", text_color="#FFFFFF")
-            self.status_label.configure(text="System Ready")
-            self.voice.announce_indicator("off")
-            self.logger.log_indicator_change("left", "OFF")
+
+        self.bus.publish(IndicatorChanged("left", self.left_indicator_active))
 
     def toggle_right_indicator(self):
         self.right_indicator_active = not self.right_indicator_active
@@ -285,17 +619,8 @@ class SmartRearViewDashboard:
         if self.right_indicator_active:
             self.left_indicator_active = False
             self.reverse_active = False
-            self.camera.switch_view("right")
-            self.view_label.configure(text="RIGHT CAMERA ►", text_color="#FF6B00")
-            self.status_label.configure(text="Right indicator ON - Monitoring right side")
-            self.voice.announce_indicator("right")
-            self.logger.log_indicator_change("right", "ON")
-        else:
-            self.camera.switch_view("center")
-            self.view_label.configure(text="CENTER VIEW", text_color="#FFFFFF")
-            self.status_label.configure(text="System Ready")
-            self.voice.announce_indicator("off")
-            self.logger.log_indicator_change("right", "OFF")
+
+        self.bus.publish(IndicatorChanged("right", self.right_indicator_active))
 
     def toggle_reverse(self):
         self.reverse_active = not self.reverse_active
@@ -303,44 +628,157 @@ class SmartRearViewDashboard:
         if self.reverse_active:
             self.left_indicator_active = False
             self.right_indicator_active = False
-            self.camera.switch_view("rear")
-            self.view_label.configure(text="⬇ REAR CAMERA", text_color="#007BFF")
-            self.status_label.configure(text="Reverse gear ENGAGED - Keep distance")
-            self.reverse_btn.configure(fg_color="#007BFF")
-            self.voice.announce_reverse(True)
-            self.logger.log_reverse_gear(True)
-        else:
-            self.camera.switch_view("center")
-            self.view_label.configure(text="CENTER VIEW", text_color="#FFFFFF")
-            self.status_label.configure(text="System Ready")
-            self.reverse_btn.configure(fg_color="#2A2A2A")
-            self.voice.announce_reverse(False)
-            self.logger.log_reverse_gear(False)
+
+        self.bus.publish(ReverseChanged(self.reverse_active))
 
     def toggle_ai(self):
         self.ai_enabled = self.ai_toggle.get()
-        self.ai_detector.enable_detection(self.ai_enabled)
+        self.bus.publish(AIToggled(bool(self.ai_enabled)))
+
+    def _camera_on_indicator(self, event: IndicatorChanged):
+        camera = self._wait_for_subsystem('camera')
+        if camera is not None:
+            camera.switch_view(event.side if event.active else "center")
+
+    def _camera_on_reverse(self, event: ReverseChanged):
+        camera = self._wait_for_subsystem('camera')
+        if camera is not None:
+            camera.switch_view("rear" if event.engaged else "center")
+
+    def _ui_on_indicator(self, event: IndicatorChanged):
+        if not event.active:
+            self.ui.configure(self.view_label, text="CENTER VIEW", text_color="#FFFFFF")
+            self.ui.configure(self.status_label, text="System Ready")
+        elif event.side == "left":
+            self.ui.configure(self.view_label, text="◄ LEFT CAMERA", text_color="#00FFAA")
+            self.ui.configure(self.status_label, text="Left indicator ON - Monitoring left side")
+        else:
+            self.ui.configure(self.view_label, text="RIGHT CAMERA ►", text_color="#FF6B00")
+            self.ui.configure(self.status_label, text="Right indicator ON - Monitoring right side")
+
+    def _ui_on_reverse(self, event: ReverseChanged):
+        if event.engaged:
+            self.ui.configure(self.view_label, text="⬇ REAR CAMERA", text_color="#007BFF")
+            self.ui.configure(self.status_label, text="Reverse gear ENGAGED - Keep distance")
+            self.ui.configure(self.reverse_btn, fg_color="#007BFF")
+        else:
+            self.ui.configure(self.view_label, text="CENTER VIEW", text_color="#FFFFFF")
+            self.ui.configure(self.status_label, text="System Ready")
+            self.ui.configure(self.reverse_btn, fg_color="#2A2A2A")
 
-        if self.ai_enabled:
-            self.status_label.configure(text="AI Detection ENABLED - Analyzing environment")
-            self.logger.log_system_event("AI Detection enabled")
+    def _ui_on_ai(self, event: AIToggled):
+        if event.enabled:
+            self.ui.configure(self.status_label, text="AI Detection ENABLED - Analyzing environment")
         else:
-            self.status_label.configure(text="AI Detection DISABLED")
-            self.logger.log_system_event("AI Detection disabled")
+            self.ui.configure(self.status_label, text="AI Detection DISABLED")
+
+    def _voice_on_indicator(self, event: IndicatorChanged):
+        voice = self._wait_for_subsystem('voice')
+        if voice is None:
+            return
+        voice.announce_indicator(event.side if event.active else "off")
+        if event.active and self.ai_enabled and self.blind_spot_monitor.is_active(event.side):
+            voice.announce_warning(f"blind_spot_{event.side}")
+
+    def _voice_on_reverse(self, event: ReverseChanged):
+        voice = self._wait_for_subsystem('voice')
+        if voice is not None:
+            voice.announce_reverse(event.engaged)
+
+    def _logger_on_indicator(self, event: IndicatorChanged):
+        logger = self._wait_for_subsystem('logger')
+        if logger is not None:
+            logger.log_indicator_change(event.side, "ON" if event.active else "OFF")
+
+    def _logger_on_reverse(self, event: ReverseChanged):
+        logger = self._wait_for_subsystem('logger')
+        if logger is not None:
+            logger.log_reverse_gear(event.engaged)
+
+    def _logger_on_ai(self, event: AIToggled):
+        logger = self._wait_for_subsystem('logger')
+        if logger is not None:
+            logger.log_system_event("AI Detection enabled" if event.enabled else "AI Detection disabled")
+
+    def _detection_on_ai(self, event: AIToggled):
+        ai_detector = self._wait_for_subsystem('ai_detector')
+        if ai_detector is None:
+            return
+        ai_detector.enable_detection(event.enabled)
+
+    def _recorder_on_reverse(self, event: ReverseChanged):
+        recorder = self._wait_for_subsystem('recorder')
+        if event.engaged and recorder is not None:
+            recorder.trigger_event("reverse")
 
     def _update_gps_display(self, lat, lon, speed):
-        self.gps_label.configure(text=f"Lat: {lat:.4f}\nLon: {lon:.4f}")
-        self.speed_label.configure(text=f"Speed: {int(speed)} km/h")
+        self.ui.configure(self.gps_label, text=f"Lat: {lat:.4f}\nLon: {lon:.4f}")
+        self.ui.configure(self.speed_label, text=f"Speed: {int(speed)} km/h")
+
+        if self.gps is not None and self.gps.is_near_intersection():
+            self.ui.configure(self.status_label, text="⚠ Approaching intersection - Extra caution")
 
-        if self.gps.is_near_intersection():
-            self.status_label.configure(text="⚠ Approaching intersection - Extra caution")
+    def _wait_for_subsystem(self, name: str):
+        value = self.startup.wait(name, self.event_wait_timeout)
+        if value is None and name in self.startup.pending():
+            print(f"Dropped event for {name}: not ready after {self.event_wait_timeout:.1f} s")
+        return value
+
+    def _settled_subsystems(self, timeout: float):
+        deadline = time.monotonic() + timeout
+        return {
+            name: self.startup.wait(name, max(0.0, deadline - time.monotonic()))
+            for name in self.startup.subsystems
+        }
 
     def stop_system(self):
+        if self.shutdown_thread is not None:
+            return
+
         self.is_recording = False
-        self.camera.stop_camera()
-        self.gps.stop()
-        self.voice.stop()
-        self.logger.log_system_event("Smart Rear-View System stopped")
+        self.startup.stop()
+        self.ui.configure(self.status_label, text="Shutting down...")
+        self.ui.configure(self.stop_btn, state="disabled")
+
+        self.shutdown_thread = threading.Thread(target=self._shutdown, name="shutdown", daemon=True)
+        self.shutdown_thread.start()
+        self.root.after(50, self._finish_shutdown)
+
+    def _shutdown(self):
+        subsystems = self._settled_subsystems(self.shutdown_timeout)
+
+        if self.video_thread is not None:
+            self.video_thread.join(1.0)
+        self.bus.stop()
+
+        camera = subsystems.get('camera')
+        if camera is not None:
+            camera.stop_camera()
+        gps = subsystems.get('gps')
+        if gps is not None:
+            gps.stop()
+        voice = subsystems.get('voice')
+        if voice is not None:
+            voice.stop()
+        detection_pool = subsystems.get('detection_pool')
+        if detection_pool is not None:
+            detection_pool.stop()
+        logger = subsystems.get('logger')
+        if logger is not None:
+            logger.log_system_event("Smart Rear-View System stopped")
+            logger.stop()
+        recorder = subsystems.get('recorder')
+        if recorder is not None:
+            recorder.stop()
+        if self.metrics_exporter is not None:
+            self.metrics_exporter.stop()
+
+    def _finish_shutdown(self):
+        if self.shutdown_thread.is_alive():
+            self.root.after(50, self._finish_shutdown)
+            return
+
+        self.ui.stop()
         self.root.quit()
 
     def run(self):
@@ -0,0 +1,40 @@
+import time
+import numpy as np
+from modules.detection_worker import DetectionPool
+
+def wait_for_results(pool, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    results = []
+    while pool.pending and time.monotonic() < deadline:
+        results.extend(pool.take_results())
+        time.sleep(0.01)
+    return results + pool.take_results()
+
+def test_worker_exception_clears_pending():
+    pool = DetectionPool(num_workers=1, slots_per_worker=2, max_frame_bytes=64 * 64 * 3)
+    try:
+        frame = np.zeros((64, 64, 3), dtype=np.uint8)
+        assert pool.submit(frame, 1, {'blind_spot': None})
+        assert pool.submit(frame, 2, {'blind_spot': ['left']})
+
+        results = wait_for_results(pool)
+
+        assert pool.pending == set()
+        assert pool.discarded == set()
+        assert pool.in_flight() == 0
+        assert pool.failed == 1
+        assert [result.sequence for result in results] == [2]
+    finally:
+        pool.stop()
+
+def test_discarded_failure_is_not_kept():
+    pool = DetectionPool(num_workers=1, slots_per_worker=1, max_frame_bytes=64 * 64 * 3)
+    try:
+        assert pool.submit(np.zeros((64, 64, 3), dtype=np.uint8), 7, {'blind_spot': None})
+        pool.discard(7)
+
+        assert wait_for_results(pool) == []
+        assert pool.pending == set()
+        assert pool.discarded == set()
+    finally:
+        pool.stop()
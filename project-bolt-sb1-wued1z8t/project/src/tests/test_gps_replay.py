@@ -0,0 +1,44 @@
+from modules.gps_replay import GPSReplaySource, KNOTS_TO_KMH, load_nmea_trace
+
+GGA_FIRST = """\
+$GPGGA,123519,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,*47
+$GPRMC,123519,A,4807.038,N,01131.000,E,022.4,084.4,230394,003.1,W*6A
+$GPGGA,123520,4807.048,N,01131.010,E,1,08,0.9,545.4,M,46.9,M,,*47
+$GPRMC,123520,A,4807.048,N,01131.010,E,022.6,084.6,230394,003.1,W*6A
+$GPGGA,123521,4807.058,N,01131.020,E,1,08,0.9,545.4,M,46.9,M,,*47
+$GPRMC,123521,A,4807.058,N,01131.020,E,022.8,084.8,230394,003.1,W*6A
+"""
+
+def write_trace(tmp_path, text):
+    path = tmp_path / "drive.nmea"
+    path.write_text(text)
+    return str(path)
+
+def test_gga_before_rmc_uses_rmc_date(tmp_path):
+    points = load_nmea_trace(write_trace(tmp_path, GGA_FIRST))
+
+    assert len(points) == 3
+    assert points[0].timestamp == 764426119.0
+    assert [p.timestamp - points[0].timestamp for p in points] == [0.0, 1.0, 2.0]
+
+def test_gga_and_rmc_merge_speed_and_course(tmp_path):
+    points = load_nmea_trace(write_trace(tmp_path, GGA_FIRST))
+
+    assert points[0].speed == 22.4 * KNOTS_TO_KMH
+    assert points[0].course == 84.4
+    assert points[2].course == 84.8
+
+def test_undated_fixes_before_midnight_use_previous_day(tmp_path):
+    text = (
+        "$GPGGA,235959,4807.038,N,01131.000,E,1,08,0.9,545.4,M,46.9,M,,*47\n"
+        "$GPRMC,000000,A,4807.048,N,01131.010,E,010.0,090.0,240394,003.1,W*6A\n"
+    )
+    points = load_nmea_trace(write_trace(tmp_path, text))
+
+    assert [p.timestamp for p in points] == [764467199.0, 764467200.0]
+
+def test_replay_duration_of_gga_first_trace(tmp_path):
+    source = GPSReplaySource(write_trace(tmp_path, GGA_FIRST))
+
+    assert source.duration == 2.0
+    assert source.course == 84.4